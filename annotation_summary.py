@@ -0,0 +1,203 @@
+import json
+import sys
+from collections import Counter
+from skill_bitset import SkillVocabulary
+
+EXACT_FIELDS = {
+    'content_types': 'content_type',
+    'experience_levels': 'experience_level_annotated',
+    'question_types': 'question_type_annotated',
+    'difficulty_levels': 'difficulty_level',
+    'profile_strengths': 'profile_strength',
+    'cities': 'location_city',
+    'work_modes': 'work_mode'
+}
+
+SKETCH_FIELDS = {
+    'top_skills': 'skill_mask',
+    'top_companies': 'company'
+}
+
+
+def sorted_counts(counter, limit=None):
+    items = sorted(counter.items(), key=lambda item: (-item[1], str(item[0])))
+    return dict(items[:limit] if limit else items)
+
+
+class HeavyHitterSketch:
+    # Misra-Gries counters: bounded to `capacity` keys. Once more than `capacity` distinct keys are seen,
+    # each count is low by at most max_error(), and the result depends on how records were batched, so
+    # callers that must agree feed the same batches in the same order (see summarize_chunks)
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.counts = Counter()
+        self.total = 0
+        
+    def update(self, counts):
+        batch = HeavyHitterSketch(self.capacity)
+        batch.counts = Counter({key: value for key, value in counts.items() if value > 0})
+        batch.total = sum(batch.counts.values())
+        merged = self.merge(batch)
+        self.counts, self.total = merged.counts, merged.total
+        
+    def merge(self, other):
+        merged = HeavyHitterSketch(min(self.capacity, other.capacity))
+        merged.counts = self.counts + other.counts
+        merged.total = self.total + other.total
+        
+        if len(merged.counts) > merged.capacity:
+            cutoff = sorted(merged.counts.values(), reverse=True)[merged.capacity]
+            merged.counts = Counter({key: value - cutoff for key, value in merged.counts.items() if value > cutoff})
+            
+        return merged
+        
+    def max_error(self):
+        return (self.total - sum(self.counts.values())) // (self.capacity + 1)
+        
+    def top(self, n=10):
+        return sorted_counts(self.counts, n)
+        
+    def to_dict(self):
+        return {'capacity': self.capacity, 'total': self.total, 'counts': dict(self.counts)}
+        
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data['capacity'])
+        sketch.counts = Counter(data['counts'])
+        sketch.total = data['total']
+        return sketch
+
+
+class SummaryAccumulator:
+    def __init__(self, vocabulary, capacity=256):
+        self.vocabulary = vocabulary
+        self.capacity = capacity
+        self.total_records = 0
+        self.exact = {}
+        self.sketches = {}
+        
+    def update(self, batch_df):
+        self.total_records += len(batch_df)
+        
+        for field, column in EXACT_FIELDS.items():
+            if column in batch_df.columns:
+                counts = batch_df[column].value_counts()
+                # Categorical columns report unused categories with a zero count
+                counts = counts[counts > 0]
+                self.exact.setdefault(field, Counter()).update(counts.to_dict())
+                
+        # Resolved names group the spelling variants of one employer
+        company_column = 'company_canonical' if 'company_canonical' in batch_df.columns else 'company'
+        if company_column in batch_df.columns:
+            counts = batch_df[company_column].value_counts()
+            counts = counts[counts > 0].to_dict()
+            self.sketches.setdefault('top_companies', HeavyHitterSketch(self.capacity)).update(counts)
+            
+        if 'skill_mask' in batch_df.columns:
+            masks = self.vocabulary.from_hex(batch_df['skill_mask'].dropna())
+            self.sketches.setdefault('top_skills', HeavyHitterSketch(self.capacity)).update(
+                self.vocabulary.skill_counts(masks)
+            )
+            diversity = Counter(self.vocabulary.category_diversity(masks).tolist())
+            self.exact.setdefault('skill_category_diversity', Counter()).update(diversity)
+            
+        return self
+        
+    def update_batches(self, df, batch_size=10000):
+        for start in range(0, len(df), batch_size):
+            self.update(df.iloc[start:start + batch_size])
+        return self
+        
+    def merge(self, other):
+        if self.vocabulary != other.vocabulary:
+            raise ValueError("Cannot merge summaries built over different skill vocabularies")
+            
+        merged = SummaryAccumulator(self.vocabulary, min(self.capacity, other.capacity))
+        merged.total_records = self.total_records + other.total_records
+        
+        for field in sorted(set(self.exact) | set(other.exact)):
+            merged.exact[field] = self.exact.get(field, Counter()) + other.exact.get(field, Counter())
+            
+        for field in sorted(set(self.sketches) | set(other.sketches)):
+            if field in self.sketches and field in other.sketches:
+                merged.sketches[field] = self.sketches[field].merge(other.sketches[field])
+            else:
+                sketch = self.sketches.get(field) or other.sketches.get(field)
+                merged.sketches[field] = sketch.merge(HeavyHitterSketch(merged.capacity))
+                
+        return merged
+        
+    def to_summary(self, top_n=10):
+        summary = {'total_records': self.total_records}
+        
+        for field in EXACT_FIELDS:
+            if field in self.exact:
+                summary[field] = sorted_counts(self.exact[field])
+                
+        for field in SKETCH_FIELDS:
+            if field in self.sketches:
+                summary[field] = self.sketches[field].top(top_n)
+                
+        # How far each sketch count may be below the true count; 0 means the counts are exact
+        bounds = {field: self.sketches[field].max_error() for field in SKETCH_FIELDS if field in self.sketches}
+        if bounds:
+            summary['sketch_max_error'] = bounds
+            
+        if 'skill_category_diversity' in self.exact:
+            summary['skill_category_diversity'] = dict(sorted(self.exact['skill_category_diversity'].items()))
+            
+        return summary
+        
+    def to_dict(self):
+        return {
+            'vocabulary': self.vocabulary.to_dict(),
+            'capacity': self.capacity,
+            'total_records': self.total_records,
+            'exact': {field: dict(counter) for field, counter in self.exact.items()},
+            'sketches': {field: sketch.to_dict() for field, sketch in self.sketches.items()}
+        }
+        
+    @classmethod
+    def from_dict(cls, data):
+        accumulator = cls(SkillVocabulary.from_dict(data['vocabulary']), data['capacity'])
+        accumulator.total_records = data['total_records']
+        accumulator.exact = {field: Counter(counts) for field, counts in data['exact'].items()}
+        accumulator.sketches = {field: HeavyHitterSketch.from_dict(sketch) for field, sketch in data['sketches'].items()}
+        
+        # JSON object keys are strings; diversity buckets are category counts
+        if 'skill_category_diversity' in accumulator.exact:
+            accumulator.exact['skill_category_diversity'] = Counter(
+                {int(key): value for key, value in accumulator.exact['skill_category_diversity'].items()}
+            )
+            
+        return accumulator
+        
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def load_summary(path):
+    if not path.endswith('.csv'):
+        return SummaryAccumulator.load(path)
+        
+    # Annotated CSV exports are streamed from disk rather than loaded whole
+    from data_annotator import RecruitmentDataAnnotator
+    return RecruitmentDataAnnotator(input_file=None).accumulate_file(path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python annotation_summary.py SUMMARY.json|ANNOTATED.csv [...]")
+        sys.exit(1)
+        
+    combined = load_summary(sys.argv[1])
+    for path in sys.argv[2:]:
+        combined = combined.merge(load_summary(path))
+        
+    print(json.dumps(combined.to_summary(), indent=2))
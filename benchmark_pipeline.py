@@ -0,0 +1,190 @@
+import argparse
+import contextlib
+import io
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+import pandas as pd
+from synthetic_data import SyntheticCorpusGenerator
+from data_cleaner import RecruitmentDataCleaner
+from data_annotator import RecruitmentDataAnnotator
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+MB = 1024 * 1024
+
+# ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+MAXRSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+
+def count_rows(result):
+    if isinstance(result, pd.DataFrame):
+        return len(result)
+    if isinstance(result, tuple) and all(isinstance(part, pd.DataFrame) for part in result):
+        return sum(len(part) for part in result)
+    return None
+
+
+def current_rss():
+    try:
+        with open('/proc/self/statm', encoding='ascii') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        # Without /proc only the lifetime peak is available
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * MAXRSS_UNIT
+
+
+def arrow_allocated():
+    try:
+        import pyarrow
+    except ImportError:
+        return 0
+    return pyarrow.total_allocated_bytes()
+
+
+def child_peak_rss():
+    # Largest finished child process so far, e.g. an annotation worker
+    return resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * MAXRSS_UNIT
+
+
+class MemorySampler:
+    # tracemalloc only sees Python allocations; RSS and the Arrow pool also cover native buffers
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak_rss = 0
+        self.peak_arrow = 0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        
+    def sample(self):
+        self.peak_rss = max(self.peak_rss, current_rss())
+        self.peak_arrow = max(self.peak_arrow, arrow_allocated())
+        
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+            
+    def __enter__(self):
+        self.sample()
+        self.thread.start()
+        return self
+        
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+        self.sample()
+
+
+def git_revision():
+    try:
+        repo_dir = os.path.dirname(os.path.abspath(__file__))
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=repo_dir,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+class PipelineBenchmark:
+    def __init__(self, sizes=None, seed=42, trace_memory=True, n_workers=1, work_dir=None, compact_dtypes=False):
+        self.sizes = sizes or DEFAULT_SIZES
+        self.seed = seed
+        self.trace_memory = trace_memory
+        self.n_workers = n_workers
+        self.work_dir = work_dir
+        self.compact_dtypes = compact_dtypes
+        self.results = []
+        self.run_info = {
+            'run_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'seed': seed,
+            'n_workers': n_workers,
+            'compact_dtypes': compact_dtypes
+        }
+        
+    def measure(self, size, stage, func):
+        if self.trace_memory:
+            tracemalloc.start()
+            
+        start = time.perf_counter()
+        # Stage methods report progress with print; keep the benchmark output readable
+        with contextlib.redirect_stdout(io.StringIO()), MemorySampler() as sampler:
+            result = func()
+        elapsed = time.perf_counter() - start
+        
+        peak_mb = None
+        if self.trace_memory:
+            peak_mb = tracemalloc.get_traced_memory()[1] / MB
+            tracemalloc.stop()
+            
+        rows = count_rows(result)
+        self.results.append(dict(
+            self.run_info, rows_in=size, stage=stage, seconds=round(elapsed, 4),
+            peak_mb=round(peak_mb, 2) if peak_mb is not None else None,
+            peak_rss_mb=round(sampler.peak_rss / MB, 2), peak_arrow_mb=round(sampler.peak_arrow / MB, 2),
+            worker_peak_rss_mb=round(child_peak_rss() / MB, 2) if self.n_workers > 1 else None,
+            rows_out=rows
+        ))
+        peak = f", traced peak {peak_mb:.1f} MB" if peak_mb is not None else ''
+        print(f"  {stage:<40} {elapsed:9.3f}s{peak}, RSS peak {sampler.peak_rss / MB:.1f} MB, "
+              f"Arrow peak {sampler.peak_arrow / MB:.1f} MB")
+        return result
+        
+    def run_size(self, size, work_dir):
+        print(f"Benchmarking {size} rows...")
+        raw_file = os.path.join(work_dir, f"synthetic_{size}.csv")
+        generator = SyntheticCorpusGenerator(seed=self.seed)
+        self.measure(size, 'generate', lambda: generator.write_csv(raw_file, size))
+        
+        cleaner = RecruitmentDataCleaner(input_file=raw_file, compact_dtypes=self.compact_dtypes)
+        self.measure(size, 'clean.load_data', lambda: cleaner.load_data() and cleaner.df)
+        
+        for _, step in cleaner.cleaning_steps():
+            stage = 'clean.' + step.__name__
+            self.measure(size, stage, lambda: step() or cleaner.df)
+            
+        cleaned_df = cleaner.df.reset_index(drop=True)
+        
+        annotator = RecruitmentDataAnnotator(input_file=None, n_workers=self.n_workers, compact_dtypes=self.compact_dtypes)
+        annotator.df = cleaned_df
+        passes = self.measure(size, 'annotate.run_annotation_passes', annotator.run_annotation_passes)
+        sample = self.measure(size, 'annotate.sample_annotations', lambda: annotator.sample_annotations(passes, 25))
+        self.measure(size, 'annotate.generate_annotation_summary',
+                     lambda: annotator.generate_annotation_summary(sample))
+        
+    def run(self):
+        with tempfile.TemporaryDirectory(dir=self.work_dir) as work_dir:
+            for size in self.sizes:
+                self.run_size(size, work_dir)
+        return pd.DataFrame(self.results)
+        
+    def save_results(self, output_file='benchmark_results.csv'):
+        results = pd.DataFrame(self.results)
+        # Keeping earlier runs around allows regression comparisons; files from before a column was added
+        # are rewritten with the new columns left empty for their rows
+        if os.path.exists(output_file):
+            results = pd.concat([pd.read_csv(output_file), results], ignore_index=True)
+        results['rows_out'] = results['rows_out'].astype('Int64')
+        results.to_csv(output_file, index=False)
+        print(f"Benchmark results saved to {output_file}. Measurements: {len(results)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure per-stage time and peak memory of the cleaner and annotator")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="corpus sizes, e.g. 1000 10000 10000000")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workers', type=int, default=1, help="annotation worker processes")
+    parser.add_argument('--compact-dtypes', action='store_true', help="load categoricals and Arrow-backed strings")
+    parser.add_argument('--no-memory', action='store_true', help="skip tracemalloc, which slows Python-heavy stages; RSS is always sampled")
+    parser.add_argument('--output', default='benchmark_results.csv')
+    args = parser.parse_args()
+    
+    benchmark = PipelineBenchmark(sizes=args.sizes, seed=args.seed, trace_memory=not args.no_memory, n_workers=args.workers,
+                                  compact_dtypes=args.compact_dtypes)
+    benchmark.run()
+    benchmark.save_results(args.output)
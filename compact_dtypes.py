@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+# Enumerated fields with a handful of distinct values
+CATEGORICAL_COLUMNS = ['source', 'content_type', 'experience_level', 'difficulty', 'category', 'domain', 'location', 'salary']
+
+# Free text that is searched and rewritten with the str accessor
+TEXT_COLUMNS = ['content', 'job_title', 'company', 'description', 'experience']
+
+
+def text_dtype():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("pyarrow is not installed; falling back to Python-backed string columns")
+        return pd.StringDtype('python')
+    return pd.StringDtype('pyarrow')
+
+
+def compact_dtype_map(columns):
+    dtypes = {}
+    string_dtype = text_dtype()
+    for col in columns:
+        if col in CATEGORICAL_COLUMNS:
+            dtypes[col] = 'category'
+        elif col in TEXT_COLUMNS:
+            dtypes[col] = string_dtype
+    return dtypes
+
+
+def to_compact(df):
+    return df.astype(compact_dtype_map(df.columns))
+
+
+def restore_dtype(values, dtype):
+    if isinstance(dtype, pd.CategoricalDtype):
+        return values.astype('category')
+    if isinstance(dtype, pd.StringDtype):
+        return values.astype(dtype)
+    return values
+
+
+def map_unique(series, func):
+    # Apply func once per distinct value instead of once per row
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    mapped = np.empty(len(uniques) + 1, dtype=object)
+    mapped[:len(uniques)] = [func(value) for value in uniques]
+    mapped[-1] = func(np.nan) if (codes < 0).any() else np.nan
+    
+    result = pd.Series(mapped[codes], index=series.index, name=series.name)
+    return restore_dtype(result, series.dtype)
+
+
+def text_values(series):
+    if isinstance(series.dtype, pd.StringDtype):
+        return series
+    return series.map(lambda value: value if isinstance(value, str) else str(value), na_action='ignore').astype(object)
+
+
+def memory_usage_mb(df):
+    return df.memory_usage(deep=True).sum() / (1024 * 1024)
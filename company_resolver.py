@@ -0,0 +1,193 @@
+import html
+import json
+import os
+import re
+import threading
+import numpy as np
+import pandas as pd
+
+# Trailing tokens that only state the legal form
+LEGAL_SUFFIXES = {
+    'pvt', 'private', 'ltd', 'limited', 'p', 'llp', 'llc', 'inc', 'incorporated', 'corp', 'corporation',
+    'co', 'company', 'plc', 'gmbh'
+}
+
+# "X India Pvt Ltd" is X's Indian subsidiary; "Air India" or "Coal India Limited" are names in their own right
+SUBSIDIARY_FORMS = {'pvt', 'private'}
+
+# Generic line-of-business words; kept in the key, but matched separately from the distinctive core
+DESCRIPTOR_SUFFIXES = {
+    'technologies', 'technology', 'tech', 'solutions', 'solution', 'software', 'softwares', 'services',
+    'systems', 'labs', 'infotech', 'consulting', 'consultancy', 'group', 'global', 'enterprises'
+}
+
+COMPANY_COLUMNS = ['company_id', 'company_canonical']
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def company_tokens(name):
+    text = html.unescape(str(name)).lower().replace('&', ' and ')
+    tokens = TOKEN_PATTERN.findall(text)
+    
+    # Never strip the only token left, so "Limited" or "India" stay a company of their own
+    stripped = set()
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        stripped.add(tokens.pop())
+    if len(tokens) > 1 and tokens[-1] == 'india' and stripped & SUBSIDIARY_FORMS:
+        tokens.pop()
+        
+    return tokens
+
+
+def company_key(name):
+    if pd.isna(name):
+        return None
+    return ' '.join(company_tokens(name)) or None
+
+
+def split_descriptors(key):
+    # "tekshapers software solutions" -> ("tekshapers", {"software", "solutions"})
+    tokens = key.split(' ')
+    end = len(tokens)
+    while end > 1 and tokens[end - 1] in DESCRIPTOR_SUFFIXES:
+        end -= 1
+    return ' '.join(tokens[:end]), frozenset(tokens[end:])
+
+
+def display_name(name):
+    # The raw spelling up to its last token that is not a legal suffix, e.g. "BHTC India Pvt Ltd" -> "BHTC"
+    text = re.sub(r'\s+', ' ', html.unescape(str(name))).strip()
+    n_tokens = len(company_tokens(name))
+    matches = list(re.finditer(r'[A-Za-z0-9]+|&', text))
+    if n_tokens == 0 or not matches:
+        return text
+    return text[:matches[min(n_tokens, len(matches)) - 1].end()]
+
+
+def trigrams(key):
+    # One space of padding marks word boundaries without a gram every name starting with that letter shares
+    padded = f" {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CompanyResolver:
+    def __init__(self, threshold=0.8):
+        self.threshold = threshold
+        self.companies = []
+        self.aliases = {}
+        self.gram_index = {}
+        self.company_grams = []
+        self.company_descriptors = []
+        self.lock = threading.Lock()
+        
+    def add_company(self, key, name):
+        company_id = len(self.companies)
+        self.companies.append({'id': company_id, 'name': name, 'key': key})
+        
+        # Only the distinctive core is indexed, so shared words like "technologies" don't link every company
+        core, descriptors = split_descriptors(key)
+        grams = trigrams(core)
+        self.company_grams.append(grams)
+        self.company_descriptors.append(descriptors)
+        for gram in grams:
+            self.gram_index.setdefault(gram, []).append(company_id)
+            
+        return company_id
+        
+    def best_match(self, key):
+        core, descriptors = split_descriptors(key)
+        grams = trigrams(core)
+        size = len(grams)
+        
+        # Dice >= t needs at least t*|A|/(2-t) shared grams and a size within [|A|*t/(2-t), |A|*(2-t)/t]
+        min_shared = int(np.ceil(self.threshold * size / (2 - self.threshold)))
+        min_size = size * self.threshold / (2 - self.threshold)
+        max_size = size * (2 - self.threshold) / self.threshold
+        
+        # Prefix filter: any match shares one of the query's (|A| - min_shared + 1) rarest grams
+        probe = sorted(grams, key=lambda gram: len(self.gram_index.get(gram, ())))[:size - min_shared + 1]
+        candidates = set()
+        for gram in probe:
+            candidates.update(self.gram_index.get(gram, ()))
+            
+        scores = {}
+        for company_id in candidates:
+            other = self.company_grams[company_id]
+            if not min_size <= len(other) <= max_size:
+                continue
+            # "Infosys" / "Infosys Technologies" match, "Tata Consultancy Services" / "Tata Technologies" don't
+            other_descriptors = self.company_descriptors[company_id]
+            if not (descriptors <= other_descriptors or other_descriptors <= descriptors):
+                continue
+            scores[company_id] = 2.0 * len(grams & other) / (size + len(other))
+            
+        if not scores:
+            return None
+            
+        best_score = max(scores.values())
+        best_ids = [company_id for company_id, score in scores.items() if score == best_score]
+        
+        # A bare "Tata" next to several Tata companies is ambiguous, so it becomes its own company
+        if best_score < self.threshold or len(best_ids) > 1:
+            return None
+        return best_ids[0]
+        
+    def resolve(self, name):
+        key = company_key(name)
+        if key is None:
+            return None
+            
+        with self.lock:
+            if key in self.aliases:
+                return self.aliases[key]
+                
+            company_id = self.best_match(key)
+            if company_id is None:
+                company_id = self.add_company(key, display_name(name))
+                
+            self.aliases[key] = company_id
+            return company_id
+            
+    def canonical_name(self, company_id):
+        return None if company_id is None else self.companies[company_id]['name']
+        
+    def resolve_series(self, companies):
+        # Known spellings are a dictionary lookup; only new keys go through blocking and scoring
+        codes, uniques = pd.factorize(companies)
+        ids = [self.resolve(value) for value in uniques]
+        
+        id_values = np.array(ids + [None], dtype=object)[codes]
+        name_values = np.array([self.canonical_name(company_id) for company_id in ids] + [None], dtype=object)[codes]
+        
+        return pd.DataFrame({
+            'company_id': pd.array(id_values, dtype='Int32'),
+            'company_canonical': pd.Categorical(name_values)
+        }, index=companies.index)
+        
+    def to_dict(self):
+        return {
+            'threshold': self.threshold,
+            'companies': self.companies,
+            'aliases': self.aliases
+        }
+        
+    @classmethod
+    def from_dict(cls, data):
+        resolver = cls(data.get('threshold', 0.8))
+        for company in data['companies']:
+            resolver.add_company(company['key'], company['name'])
+        resolver.aliases = dict(data['aliases'])
+        return resolver
+        
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            
+    @classmethod
+    def load(cls, path, threshold=0.8):
+        if not os.path.exists(path):
+            return cls(threshold)
+            
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
@@ -1,12 +1,42 @@
 import pandas as pd
+import numpy as np
 import re
 import random
-from collections import Counter
+from functools import reduce
+from concurrent.futures import ProcessPoolExecutor
+from skill_bitset import SkillVocabulary, vocabulary_path, serialize_skill_list, parse_skill_list
+from annotation_summary import SummaryAccumulator
+from compact_dtypes import compact_dtype_map, map_unique, to_compact
+from experience_years import level_from_years, EXPERIENCE_COLUMNS
+
+ANNOTATION_PASSES = ('job_description', 'interview_question', 'resume_summary')
+
+# Per-process annotator used by the parallel engine, built once per worker
+_worker_annotator = None
+
+
+def _init_annotation_worker(taxonomy, chunk_size, summary_capacity):
+    global _worker_annotator
+    _worker_annotator = RecruitmentDataAnnotator(input_file=None, chunk_size=chunk_size, summary_capacity=summary_capacity)
+    _worker_annotator.set_taxonomy(taxonomy)
+
+
+def _annotate_chunk(chunk):
+    _worker_annotator.df = chunk
+    passes = _worker_annotator.annotate_passes()
+    return passes, _worker_annotator.summarize_passes(passes)
+
 
 class RecruitmentDataAnnotator:
-    def __init__(self, input_file='cleaned_recruitment_data.csv'):
+    def __init__(self, input_file='cleaned_recruitment_data.csv', n_workers=1, chunk_size=5000, summary_capacity=256,
+                 compact_dtypes=False):
         self.input_file = input_file
+        self.compact_dtypes = compact_dtypes
         self.df = None
+        self.n_workers = n_workers
+        self.chunk_size = chunk_size
+        self.summary_capacity = summary_capacity
+        self.corpus_summary = None
         
         self.skill_keywords = {
             'programming_languages': ['python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 'kotlin', 'swift', 'typescript', 'scala', 'rust'],
@@ -30,9 +60,34 @@ class RecruitmentDataAnnotator:
             'conceptual': ['what is', 'explain', 'difference between', 'how does', 'define']
         }
         
+        self.compile_taxonomy()
+        
+    def get_taxonomy(self):
+        return {
+            'skill_keywords': self.skill_keywords,
+            'experience_patterns': self.experience_patterns,
+            'question_types': self.question_types
+        }
+        
+    def set_taxonomy(self, taxonomy):
+        self.skill_keywords = taxonomy['skill_keywords']
+        self.experience_patterns = taxonomy['experience_patterns']
+        self.question_types = taxonomy['question_types']
+        self.compile_taxonomy()
+        
+    def compile_taxonomy(self):
+        self.skill_vocab = SkillVocabulary(self.skill_keywords)
+        self.compiled_experience_patterns = {
+            level: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for level, patterns in self.experience_patterns.items()
+        }
+        
     def load_data(self):
         try:
-            self.df = pd.read_csv(self.input_file)
+            dtypes = None
+            if self.compact_dtypes:
+                dtypes = compact_dtype_map(pd.read_csv(self.input_file, nrows=0).columns)
+            self.df = pd.read_csv(self.input_file, dtype=dtypes)
             print(f"Loaded {len(self.df)} records from {self.input_file}")
             return True
         except FileNotFoundError:
@@ -44,14 +99,17 @@ class RecruitmentDataAnnotator:
             return []
             
         text = str(text).lower()
-        found_skills = []
         
-        for category, skills in self.skill_keywords.items():
-            for skill in skills:
-                if skill in text:
-                    found_skills.append(skill)
-                    
-        return list(set(found_skills))
+        # Vocabulary order keeps the result stable across runs and processes
+        return [skill for skill in self.skill_vocab.skills if skill in text]
+        
+    def extract_skill_sets(self, texts):
+        # Arrow-backed text is scanned as plain Python strings too; a str.contains pass per vocabulary skill
+        # was slower than one pass over the rows, and iterating the Arrow array directly is slower still
+        if isinstance(texts.dtype, pd.StringDtype):
+            texts = texts.to_numpy(dtype=object, na_value=np.nan)
+        skill_lists = [self.extract_skills(text) for text in texts]
+        return skill_lists, self.skill_vocab.encode_many(skill_lists)
         
     def determine_experience_level(self, text, existing_level=None):
         if existing_level and existing_level in ['junior', 'mid', 'senior']:
@@ -62,9 +120,9 @@ class RecruitmentDataAnnotator:
             
         text = str(text).lower()
         
-        for level, patterns in self.experience_patterns.items():
+        for level, patterns in self.compiled_experience_patterns.items():
             for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
+                if pattern.search(text):
                     return level
                     
         skill_count = len(self.extract_skills(text))
@@ -95,17 +153,14 @@ class RecruitmentDataAnnotator:
         job_mask = self.df['content_type'] == 'job_description'
         job_data = self.df[job_mask].copy()
         
-        job_data['extracted_skills'] = job_data['content'].apply(self.extract_skills)
-        job_data['skill_count'] = job_data['extracted_skills'].apply(len)
+        job_data['extracted_skills'], job_masks = self.extract_skill_sets(job_data['content'])
+        job_data['skill_mask'] = self.skill_vocab.to_hex(job_masks)
+        job_data['skill_count'] = self.skill_vocab.popcount(job_masks)
         job_data['primary_skills'] = job_data['extracted_skills'].apply(lambda x: ', '.join(x[:5]) if x else 'None')
         
-        job_data['experience_level_annotated'] = job_data.apply(
-            lambda row: self.determine_experience_level(row['content'], row.get('experience_level')), axis=1
-        )
+        job_data['experience_level_annotated'] = self.experience_levels(job_data)
         
-        job_data['content_complexity'] = job_data['skill_count'].apply(
-            lambda x: 'high' if x >= 8 else 'medium' if x >= 4 else 'low'
-        )
+        job_data['content_complexity'] = job_data['skill_count'].apply(self.content_complexity)
         
         return job_data
         
@@ -113,14 +168,11 @@ class RecruitmentDataAnnotator:
         interview_mask = self.df['content_type'] == 'interview_question'
         interview_data = self.df[interview_mask].copy()
         
-        interview_data['question_type_annotated'] = interview_data['content'].apply(self.classify_question_type)
+        interview_data['question_type_annotated'] = map_unique(interview_data['content'], self.classify_question_type).astype(object)
         
-        interview_data['difficulty_level'] = interview_data.apply(
-            lambda row: row.get('difficulty', 'medium') if pd.notna(row.get('difficulty')) 
-            else self.infer_difficulty(row['content']), axis=1
-        )
+        interview_data['difficulty_level'] = interview_data.apply(self.difficulty_level, axis=1)
         
-        interview_data['related_skills'] = interview_data['content'].apply(self.extract_skills)
+        interview_data['related_skills'] = self.extract_skill_sets(interview_data['content'])[0]
         interview_data['skill_focus'] = interview_data['related_skills'].apply(
             lambda x: ', '.join(x[:3]) if x else 'General'
         )
@@ -131,23 +183,84 @@ class RecruitmentDataAnnotator:
         resume_mask = self.df['content_type'] == 'resume_summary'
         resume_data = self.df[resume_mask].copy()
         
-        resume_data['extracted_skills'] = resume_data['content'].apply(self.extract_skills)
-        resume_data['skill_diversity'] = resume_data['extracted_skills'].apply(
-            lambda x: len(set([self.categorize_skill(skill) for skill in x])) if x else 0
-        )
+        resume_data['extracted_skills'], resume_masks = self.extract_skill_sets(resume_data['content'])
+        resume_data['skill_mask'] = self.skill_vocab.to_hex(resume_masks)
+        resume_data['skill_count'] = self.skill_vocab.popcount(resume_masks)
+        resume_data['skill_diversity'] = self.skill_vocab.category_diversity(resume_masks)
         
-        resume_data['experience_level_annotated'] = resume_data.apply(
-            lambda row: self.determine_experience_level(row['content'], row.get('experience_level')), axis=1
-        )
+        resume_data['experience_level_annotated'] = self.experience_levels(resume_data)
         
         resume_data['profile_strength'] = resume_data.apply(
-            lambda row: 'strong' if len(row['extracted_skills']) >= 6 and row['skill_diversity'] >= 3
-            else 'moderate' if len(row['extracted_skills']) >= 3
-            else 'basic', axis=1
+            lambda row: self.profile_strength(row['skill_count'], row['skill_diversity']), axis=1
         )
         
         return resume_data
         
+    def experience_levels(self, data):
+        levels = np.full(len(data), None, dtype=object)
+        
+        if 'experience_level' in data.columns:
+            existing = data['experience_level'].astype(object).to_numpy()
+            reported = np.isin(existing, ['junior', 'mid', 'senior'])
+            levels[reported] = existing[reported]
+            
+        if 'exp_min_years' in data.columns:
+            derived = level_from_years(data['exp_min_years'])
+            parsed = pd.isna(levels) & pd.notna(derived)
+            levels[parsed] = derived[parsed]
+            
+        # Only rows without a reported level or parsed years reach the regex patterns
+        contents = data['content'].to_numpy()
+        for i in np.flatnonzero(pd.isna(levels)):
+            levels[i] = self.determine_experience_level(contents[i])
+        return levels
+        
+    def content_complexity(self, skill_count):
+        return 'high' if skill_count >= 8 else 'medium' if skill_count >= 4 else 'low'
+        
+    def difficulty_level(self, row):
+        if pd.notna(row.get('difficulty')):
+            return row.get('difficulty', 'medium')
+        return self.infer_difficulty(row['content'])
+        
+    def profile_strength(self, skill_count, skill_diversity):
+        if skill_count >= 6 and skill_diversity >= 3:
+            return 'strong'
+        elif skill_count >= 3:
+            return 'moderate'
+        else:
+            return 'basic'
+            
+    def annotate_record(self, record):
+        record = dict(record)
+        content_type = record.get('content_type')
+        
+        if content_type in ('job_description', 'resume_summary'):
+            skills = self.extract_skills(record['content'])
+            mask = self.skill_vocab.encode(skills)
+            record['extracted_skills'] = skills
+            record['skill_mask'] = self.skill_vocab.to_hex(mask)[0]
+            record['skill_count'] = len(skills)
+            record['experience_level_annotated'] = self.determine_experience_level(
+                record['content'], record.get('experience_level')
+            )
+            
+            if content_type == 'job_description':
+                record['primary_skills'] = ', '.join(skills[:5]) if skills else 'None'
+                record['content_complexity'] = self.content_complexity(len(skills))
+            else:
+                record['skill_diversity'] = int(self.skill_vocab.category_diversity(mask)[0])
+                record['profile_strength'] = self.profile_strength(len(skills), record['skill_diversity'])
+                
+        elif content_type == 'interview_question':
+            skills = self.extract_skills(record['content'])
+            record['question_type_annotated'] = self.classify_question_type(record['content'])
+            record['difficulty_level'] = self.difficulty_level(record)
+            record['related_skills'] = skills
+            record['skill_focus'] = ', '.join(skills[:3]) if skills else 'General'
+            
+        return record
+        
     def categorize_skill(self, skill):
         for category, skills in self.skill_keywords.items():
             if skill in skills:
@@ -164,18 +277,72 @@ class RecruitmentDataAnnotator:
         else:
             return 'beginner'
             
-    def create_sample_annotations(self, n_samples=20):
-        annotated_samples = []
+    def annotate_passes(self):
+        return (
+            self.annotate_job_descriptions(),
+            self.annotate_interview_questions(),
+            self.annotate_resumes()
+        )
         
-        job_annotations = self.annotate_job_descriptions()
-        interview_annotations = self.annotate_interview_questions()
-        resume_annotations = self.annotate_resumes()
+    def summarize_passes(self, passes):
+        accumulator = SummaryAccumulator(self.skill_vocab, self.summary_capacity)
+        for annotated_data in passes:
+            accumulator.update_batches(annotated_data, self.chunk_size)
+        return accumulator
+        
+    def merge_summaries(self, partial_summaries):
+        # Folding in chunk order keeps the merged summary independent of worker scheduling
+        return reduce(lambda left, right: left.merge(right), partial_summaries)
+        
+    def summarize_chunks(self, passes, index):
+        # Summarizes each chunk_size slice of the frame behind `index` and merges them in chunk order, exactly
+        # as the process pool does, so the Misra-Gries reductions and the summary match whatever the worker count
+        n_chunks = max(1, -(-len(index) // self.chunk_size))
+        boundaries = []
+        for annotated_data in passes:
+            # Passes keep the input order, so each pass's chunk numbers are sorted
+            chunks = index.get_indexer(annotated_data.index) // self.chunk_size
+            boundaries.append(np.searchsorted(chunks, np.arange(n_chunks + 1)))
+            
+        return self.merge_summaries([
+            self.summarize_passes(tuple(
+                annotated_data.iloc[bounds[chunk]:bounds[chunk + 1]]
+                for annotated_data, bounds in zip(passes, boundaries)
+            ))
+            for chunk in range(n_chunks)
+        ])
+        
+    def run_annotation_passes(self):
+        if self.n_workers > 1 and len(self.df) > self.chunk_size:
+            return self.run_parallel_annotation_passes()
+            
+        passes = self.annotate_passes()
+        self.corpus_summary = self.summarize_chunks(passes, self.df.index)
+        return passes
+        
+    def run_parallel_annotation_passes(self):
+        chunks = [self.df.iloc[start:start + self.chunk_size] for start in range(0, len(self.df), self.chunk_size)]
+        
+        with ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            initializer=_init_annotation_worker,
+            initargs=(self.get_taxonomy(), self.chunk_size, self.summary_capacity)
+        ) as executor:
+            # map() yields in submission order, so the merge matches a sequential run
+            results = list(executor.map(_annotate_chunk, chunks))
+            
+        passes = []
+        for i in range(len(ANNOTATION_PASSES)):
+            frames = [chunk_passes[i] for chunk_passes, _ in results]
+            non_empty = [frame for frame in frames if len(frame) > 0]
+            passes.append(pd.concat(non_empty) if non_empty else frames[0])
+            
+        self.corpus_summary = self.merge_summaries([summary for _, summary in results])
+        return tuple(passes)
         
-        all_annotations = [
-            (job_annotations, 'job_description'),
-            (interview_annotations, 'interview_question'),
-            (resume_annotations, 'resume_summary')
-        ]
+    def sample_annotations(self, passes, n_samples=20):
+        annotated_samples = []
+        all_annotations = list(zip(passes, ANNOTATION_PASSES))
         
         samples_per_type = n_samples // 3
         
@@ -190,45 +357,93 @@ class RecruitmentDataAnnotator:
         else:
             final_sample = pd.DataFrame()
             
+        final_sample.attrs['skill_vocabulary'] = self.skill_vocab.to_dict()
         return final_sample
         
+    def create_sample_annotations(self, n_samples=20):
+        passes = self.run_annotation_passes()
+        return self.sample_annotations(passes, n_samples)
+        
+    def annotate_frame(self, df, n_samples=25):
+        self.df = to_compact(df) if self.compact_dtypes else df
+        return self.create_sample_annotations(n_samples)
+        
     def save_annotated_data(self, annotated_df, output_file='annotated_recruitment_data.csv'):
         columns_to_save = [
-            'source', 'content', 'content_type', 'job_title', 'company', 'location',
-            'extracted_skills', 'primary_skills', 'skill_focus', 'experience_level_annotated',
+            'source', 'content', 'content_type', 'job_title', 'company', 'company_id', 'company_canonical', 'location',
+            'location_city', 'location_state', 'work_mode',
+            'extracted_skills', 'skill_mask', 'primary_skills', 'skill_focus', 'experience_level_annotated',
+            *EXPERIENCE_COLUMNS,
             'question_type_annotated', 'difficulty_level', 'content_complexity',
             'skill_diversity', 'profile_strength', 'skill_count'
         ]
         
         available_columns = [col for col in columns_to_save if col in annotated_df.columns]
-        annotated_df[available_columns].to_csv(output_file, index=False)
+        output_df = annotated_df[available_columns].copy()
+        
+        if 'extracted_skills' in output_df.columns:
+            output_df['extracted_skills'] = output_df['extracted_skills'].apply(serialize_skill_list)
+            
+        output_df.to_csv(output_file, index=False)
+        self.skill_vocab.save(vocabulary_path(output_file))
         
         print(f"Annotated data saved to {output_file}. Total records: {len(annotated_df)}")
         
-    def generate_annotation_summary(self, annotated_df):
-        summary = {
-            'total_records': len(annotated_df),
-            'content_types': annotated_df['content_type'].value_counts().to_dict(),
-        }
+    def save_corpus_summary(self, output_file='annotation_summary.json'):
+        self.corpus_summary.save(output_file)
+        print(f"Corpus summary saved to {output_file}. Total records: {self.corpus_summary.total_records}")
         
-        if 'experience_level_annotated' in annotated_df.columns:
-            summary['experience_levels'] = annotated_df['experience_level_annotated'].value_counts().to_dict()
-            
-        if 'question_type_annotated' in annotated_df.columns:
-            summary['question_types'] = annotated_df['question_type_annotated'].value_counts().to_dict()
+    def load_vocabulary(self, input_file):
+        try:
+            return SkillVocabulary.load(vocabulary_path(input_file))
+        except FileNotFoundError:
+            return self.skill_vocab
             
+    def restore_skill_columns(self, annotated_df, vocabulary):
         if 'extracted_skills' in annotated_df.columns:
-            all_skills = []
-            for skills in annotated_df['extracted_skills'].dropna():
-                if isinstance(skills, list):
-                    all_skills.extend(skills)
-                elif isinstance(skills, str):
-                    all_skills.extend(eval(skills) if skills.startswith('[') else [skills])
+            has_skills = annotated_df['extracted_skills'].notna()
+            annotated_df['extracted_skills'] = annotated_df['extracted_skills'].where(
+                ~has_skills, annotated_df['extracted_skills'].apply(parse_skill_list)
+            )
+            
+            # Exports written before skill masks existed only carry the skill lists
+            if 'skill_mask' not in annotated_df.columns:
+                annotated_df['skill_mask'] = None
+                annotated_df.loc[has_skills, 'skill_mask'] = vocabulary.to_hex(
+                    vocabulary.encode_many(list(annotated_df.loc[has_skills, 'extracted_skills']))
+                )
+                
+        return annotated_df
+        
+    def load_annotated_data(self, input_file='annotated_recruitment_data.csv'):
+        annotated_df = pd.read_csv(input_file, dtype={'skill_mask': str})
+        vocabulary = self.load_vocabulary(input_file)
+        annotated_df = self.restore_skill_columns(annotated_df, vocabulary)
+        annotated_df.attrs['skill_vocabulary'] = vocabulary.to_dict()
+        return annotated_df
+        
+    def generate_annotation_summary(self, annotated_df, batch_size=10000):
+        vocabulary = self.skill_vocab
+        if 'skill_vocabulary' in annotated_df.attrs:
+            vocabulary = SkillVocabulary.from_dict(annotated_df.attrs['skill_vocabulary'])
             
-            skill_counter = Counter(all_skills)
-            summary['top_skills'] = dict(skill_counter.most_common(10))
+        accumulator = SummaryAccumulator(vocabulary, self.summary_capacity)
+        accumulator.update_batches(annotated_df, batch_size)
+        return accumulator.to_summary()
+        
+    def accumulate_file(self, input_file='annotated_recruitment_data.csv', batch_size=10000):
+        # Reads the export batch_size rows at a time, so files larger than memory can be summarized;
+        # the batches are the same ones generate_annotation_summary uses on the loaded frame
+        vocabulary = self.load_vocabulary(input_file)
+        accumulator = SummaryAccumulator(vocabulary, self.summary_capacity)
+        
+        for batch in pd.read_csv(input_file, dtype={'skill_mask': str}, chunksize=batch_size):
+            accumulator.update(self.restore_skill_columns(batch, vocabulary))
             
-        return summary
+        return accumulator
+        
+    def generate_file_summary(self, input_file='annotated_recruitment_data.csv', batch_size=10000):
+        return self.accumulate_file(input_file, batch_size).to_summary()
         
     def annotate_data(self):
         print("Starting data annotation process...")
@@ -236,6 +451,9 @@ class RecruitmentDataAnnotator:
         if not self.load_data():
             return False
             
+        if self.n_workers > 1:
+            print(f"Annotating with {self.n_workers} worker processes (chunk size {self.chunk_size})...")
+            
         print("Creating annotated samples...")
         annotated_df = self.create_sample_annotations(n_samples=25)
         
@@ -260,6 +478,7 @@ class RecruitmentDataAnnotator:
             print(f"Top skills: {dict(list(summary['top_skills'].items())[:5])}")
             
         self.save_annotated_data(annotated_df)
+        self.save_corpus_summary()
         print("Data annotation completed!")
         
         return True
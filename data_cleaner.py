@@ -3,37 +3,113 @@ import re
 import html
 from bs4 import BeautifulSoup
 import numpy as np
+from compact_dtypes import compact_dtype_map, map_unique, restore_dtype, text_values, to_compact
+from location_gazetteer import LocationGazetteer, LOCATION_COLUMNS
+from company_resolver import CompanyResolver
+from experience_years import parse_experience, parse_experience_text, level_from_years, EXPERIENCE_COLUMNS
+
+# Row position carried through sharded runs; never part of a record's identity
+ORDER_COLUMN = '_row_order'
 
 class RecruitmentDataCleaner:
-    def __init__(self, input_file='raw_recruitment_data.csv'):
+    def __init__(self, input_file='raw_recruitment_data.csv', compact_dtypes=False, gazetteer_file=None,
+                 company_aliases_file=None):
         self.input_file = input_file
+        self.compact_dtypes = compact_dtypes
+        self.gazetteer_file = gazetteer_file
+        self.gazetteer = LocationGazetteer.load(gazetteer_file) if gazetteer_file else LocationGazetteer()
+        self.company_aliases_file = company_aliases_file
+        self.company_resolver = CompanyResolver.load(company_aliases_file) if company_aliases_file else CompanyResolver()
         self.df = None
         
+        self.experience_mapping = {
+            'entry': 'junior',
+            'entry level': 'junior',
+            'entry-level': 'junior',
+            'fresher': 'junior',
+            'beginner': 'junior',
+            '0-2 years': 'junior',
+            'intermediate': 'mid',
+            'mid level': 'mid',
+            'mid-level': 'mid',
+            '2-5 years': 'mid',
+            '3-6 years': 'mid',
+            'experienced': 'senior',
+            'senior level': 'senior',
+            'senior-level': 'senior',
+            '5+ years': 'senior',
+            '6+ years': 'senior',
+            'expert': 'senior',
+            'lead': 'senior'
+        }
+        
+        self.content_type_mapping = {
+            'job posting': 'job_description',
+            'job_posting': 'job_description',
+            'job ad': 'job_description',
+            'job_ad': 'job_description',
+            'interview_questions': 'interview_question',
+            'interview q&a': 'interview_question',
+            'resume': 'resume_summary',
+            'cv': 'resume_summary',
+            'cv_summary': 'resume_summary'
+        }
+        
     def load_data(self):
         try:
-            self.df = pd.read_csv(self.input_file)
+            dtypes = None
+            if self.compact_dtypes:
+                dtypes = compact_dtype_map(pd.read_csv(self.input_file, nrows=0).columns)
+            self.df = pd.read_csv(self.input_file, dtype=dtypes)
             print(f"Loaded {len(self.df)} records from {self.input_file}")
         except FileNotFoundError:
             print(f"Error: {self.input_file} not found. Please run the scraper first.")
             return False
         return True
         
-    def remove_duplicates(self):
-        initial_count = len(self.df)
-        
+    def dedup_groups(self, df):
         # Interview questions and resumes
-        mask_manual = self.df['source'].str.contains('manual_collection', na=False)
-        manual = self.df[mask_manual].drop_duplicates(subset=['content', 'content_type'], keep='first')
+        mask_manual = df['source'].str.contains('manual_collection', na=False)
         
         # Job postings
-        mask_job = self.df['content_type'].str.contains('job_description', na=False)
-        jobs = self.df[mask_job].drop_duplicates(subset=['job_title', 'company', 'description', 'location'], keep='first')
+        mask_job = df['content_type'].str.contains('job_description', na=False)
         
         # Others (if any)
-        others = self.df[~(mask_manual | mask_job)].drop_duplicates(keep='first')
+        mask_others = ~(mask_manual | mask_job)
+        
+        # Resolved company IDs let spelling variants of one employer collapse
+        company_column = 'company_id' if 'company_id' in df.columns else 'company'
+        
+        return [
+            (mask_manual, ['content', 'content_type']),
+            (mask_job, ['job_title', company_column, 'description', 'location']),
+            (mask_others, list(df.columns.drop(ORDER_COLUMN, errors='ignore')))
+        ]
+        
+    def resolve_companies(self):
+        # Frames resolved upstream (e.g. by the sharded coordinator) keep their corpus-wide IDs
+        if 'company' not in self.df.columns or 'company_id' in self.df.columns:
+            return
+            
+        resolved = self.company_resolver.resolve_series(self.df['company'])
+        for column in resolved.columns:
+            self.df[column] = resolved[column]
+            
+        if self.company_aliases_file:
+            self.company_resolver.save(self.company_aliases_file)
+            
+        print(f"Resolved {self.df['company'].nunique()} company spellings to {self.df['company_id'].nunique()} companies")
+        
+    def remove_duplicates(self):
+        initial_count = len(self.df)
+        
+        groups = [
+            self.df[mask].drop_duplicates(subset=subset, keep='first')
+            for mask, subset in self.dedup_groups(self.df)
+        ]
         
         # Combine all
-        self.df = pd.concat([manual, jobs, others], ignore_index=True)
+        self.df = pd.concat(groups, ignore_index=True)
         self.df.reset_index(drop=True, inplace=True)
         
         final_count = len(self.df)
@@ -43,12 +119,14 @@ class RecruitmentDataCleaner:
         initial_count = len(self.df)
         
         important_columns = ['content', 'job_title', 'description']
-        mask = pd.Series([False] * len(self.df))
+        mask = pd.Series(False, index=self.df.index)
         
         for col in important_columns:
             if col in self.df.columns:
-                mask |= self.df[col].notna() & (self.df[col].str.strip() != '') & (self.df[col] != 'N/A')
-        
+                text = text_values(self.df[col])
+                present = text.notna() & (text.str.strip() != '') & (text != 'N/A')
+                mask |= present.fillna(False).astype(bool)
+                
         self.df = self.df[mask]
         final_count = len(self.df)
         print(f"Removed {initial_count - final_count} empty/invalid rows")
@@ -88,149 +166,243 @@ class RecruitmentDataCleaner:
         if 'experience_level' not in self.df.columns:
             return
             
-        experience_mapping = {
-            'entry': 'junior',
-            'entry level': 'junior',
-            'entry-level': 'junior',
-            'fresher': 'junior',
-            'beginner': 'junior',
-            '0-2 years': 'junior',
-            'intermediate': 'mid',
-            'mid level': 'mid',
-            'mid-level': 'mid',
-            '2-5 years': 'mid',
-            '3-6 years': 'mid',
-            'experienced': 'senior',
-            'senior level': 'senior',
-            'senior-level': 'senior',
-            '5+ years': 'senior',
-            '6+ years': 'senior',
-            'expert': 'senior',
-            'lead': 'senior'
-        }
+        self.df['experience_level'] = map_unique(self.df['experience_level'], self.standardize_experience_level)
         
-        self.df['experience_level'] = self.df['experience_level'].str.lower()
-        self.df['experience_level'] = self.df['experience_level'].replace(experience_mapping)
+    def parse_experience_years(self):
+        sources = [col for col in ['experience', 'content'] if col in self.df.columns]
+        years = pd.DataFrame(np.nan, index=self.df.index, columns=EXPERIENCE_COLUMNS, dtype='float32')
+        
+        # The scraped experience field wins; mentions in the text fill the remaining rows
+        for col in sources:
+            missing = years['exp_min_years'].isna()
+            if missing.any():
+                years.loc[missing, EXPERIENCE_COLUMNS] = parse_experience(self.df.loc[missing, col]).to_numpy()
+                
+        for column in EXPERIENCE_COLUMNS:
+            self.df[column] = years[column].astype('float32')
+            
+        # Rows without a reported level get one from the parsed minimum years
+        derived = pd.Series(level_from_years(years['exp_min_years']), index=self.df.index, dtype=object)
+        if 'experience_level' not in self.df.columns:
+            self.df['experience_level'] = derived
+            return
+            
+        levels = self.df['experience_level']
+        self.df['experience_level'] = restore_dtype(levels.astype(object).fillna(derived), levels.dtype)
         
     def standardize_content_types(self):
         if 'content_type' not in self.df.columns:
             return
             
-        type_mapping = {
-            'job posting': 'job_description',
-            'job_posting': 'job_description',
-            'job ad': 'job_description',
-            'job_ad': 'job_description',
-            'interview_questions': 'interview_question',
-            'interview q&a': 'interview_question',
-            'resume': 'resume_summary',
-            'cv': 'resume_summary',
-            'cv_summary': 'resume_summary'
-        }
+        self.df['content_type'] = map_unique(self.df['content_type'], self.standardize_content_type)
         
-        self.df['content_type'] = self.df['content_type'].str.lower()
-        self.df['content_type'] = self.df['content_type'].replace(type_mapping)
+    def standardize_experience_level(self, level):
+        if not isinstance(level, str):
+            return level
+        return self.experience_mapping.get(level.lower(), level.lower())
+        
+    def standardize_content_type(self, content_type):
+        if not isinstance(content_type, str):
+            return content_type
+        return self.content_type_mapping.get(content_type.lower(), content_type.lower())
+        
+    def clean_salary(self, salary):
+        if pd.isna(salary) or salary == '' or salary == 'N/A':
+            return 'Not disclosed'
+            
+        salary = str(salary).strip()
+        
+        salary = re.sub(r'[^\d\.\,\-\s\w]', '', salary)
+        salary = re.sub(r'\s+', ' ', salary)
+        
+        return salary
         
     def clean_salary_data(self):
         if 'salary' not in self.df.columns:
             return
             
-        def clean_salary(salary):
-            if pd.isna(salary) or salary == '' or salary == 'N/A':
-                return 'Not disclosed'
-                
-            salary = str(salary).strip()
-            
-            salary = re.sub(r'[^\d\.\,\-\s\w]', '', salary)
-            salary = re.sub(r'\s+', ' ', salary)
-            
-            return salary
+        self.df['salary'] = map_unique(self.df['salary'], self.clean_salary)
+        
+    def clean_location(self, location):
+        if pd.isna(location) or location == '' or location == 'N/A':
+            return 'Remote'
             
-        self.df['salary'] = self.df['salary'].apply(clean_salary)
+        location = str(location).strip()
+        location = self.normalize_text(location)
+        
+        location = re.sub(r'\d+\s*km.*', '', location, flags=re.IGNORECASE)
+        location = re.sub(r'(work from home|wfh|remote)', 'Remote', location, flags=re.IGNORECASE)
+        
+        return location
         
     def clean_location_data(self):
         if 'location' not in self.df.columns:
             return
             
-        def clean_location(location):
-            if pd.isna(location) or location == '' or location == 'N/A':
-                return 'Remote'
-                
-            location = str(location).strip()
-            location = self.normalize_text(location)
-            
-            location = re.sub(r'\d+\s*km.*', '', location, flags=re.IGNORECASE)
-            location = re.sub(r'(work from home|wfh|remote)', 'Remote', location, flags=re.IGNORECASE)
+        self.df['location'] = map_unique(self.df['location'], self.clean_location)
+        
+    def canonicalize_locations(self):
+        if 'location' not in self.df.columns:
+            return
             
-            return location
+        # Runs on the raw spelling, before clean_location turns missing values into 'Remote'
+        resolved = self.gazetteer.canonicalize(self.df['location'])
+        for column in LOCATION_COLUMNS:
+            self.df[column] = resolved[column]
             
-        self.df['location'] = self.df['location'].apply(clean_location)
+    def merge_content(self, row):
+        content_parts = []
+        # Add all non-empty fields
+        for field in ['content', 'description', 'job_title']:
+            val = row.get(field)
+            if pd.notna(val) and str(val).strip() != '' and str(val).strip() != 'N/A':
+                content_parts.append(str(val).strip())
+        return ' '.join(content_parts) if content_parts else ''
         
     def merge_content_fields(self):
-        def merge_content(row):
-            content_parts = []
-            # Add all non-empty fields
-            for field in ['content', 'description', 'job_title']:
-                val = row.get(field)
-                if pd.notna(val) and str(val).strip() != '' and str(val).strip() != 'N/A':
-                    content_parts.append(str(val).strip())
-            return ' '.join(content_parts) if content_parts else ''
-        self.df['content'] = self.df.apply(merge_content, axis=1)
+        merged = None
+        
+        # Column-wise equivalent of merge_content, so string columns stay in native kernels
+        for field in ['content', 'description', 'job_title']:
+            if field not in self.df.columns:
+                continue
+                
+            part = text_values(self.df[field]).str.strip()
+            part = part.where(part.notna() & (part != '') & (part != 'N/A'))
+            
+            if merged is None:
+                merged = part
+            else:
+                merged = (merged + ' ' + part).fillna(merged).fillna(part)
+                
+        if merged is None:
+            merged = pd.Series('', index=self.df.index)
+            
+        self.df['content'] = merged.fillna('')
         
     def apply_text_cleaning(self):
         text_columns = ['content', 'job_title', 'company', 'description']
         
         for col in text_columns:
             if col in self.df.columns:
-                self.df[col] = self.df[col].apply(self.normalize_text)
+                self.df[col] = map_unique(self.df[col], self.normalize_text)
                 
     def validate_and_filter(self):
         initial_count = len(self.df)
         
         if 'content' in self.df.columns:
-            self.df = self.df[self.df['content'].astype(str).str.len() >= 5]
+            content = text_values(self.df['content']).fillna('')
+            self.df = self.df[(content.str.len() >= 5).astype(bool)]
             # Only filter rows where content is entirely non-word characters
-            self.df = self.df[~self.df['content'].astype(str).str.match(r'^[^\w]+$')]
-        
+            content = content[self.df.index]
+            self.df = self.df[~content.str.match(r'^[^\w]+$').astype(bool)]
+            
         final_count = len(self.df)
         print(f"Filtered out {initial_count - final_count} records with insufficient content")
         
+    def dedup_key(self, record):
+        # Mirrors the subsets used by remove_duplicates
+        def value(field):
+            val = record.get(field)
+            return None if pd.isna(val) else val
+            
+        if 'manual_collection' in str(value('source') or ''):
+            return ('manual', value('content'), value('content_type'))
+        if 'job_description' in str(value('content_type') or ''):
+            company_id = self.company_resolver.resolve(value('company'))
+            return ('job', value('job_title'), company_id, value('description'), value('location'))
+        return ('other',) + tuple(value(field) for field in sorted(record))
+        
+    def is_empty_record(self, record):
+        for field in ['content', 'job_title', 'description']:
+            val = record.get(field)
+            if pd.notna(val) and str(val).strip() != '' and val != 'N/A':
+                return False
+        return True
+        
+    def clean_record(self, record):
+        if self.is_empty_record(record):
+            return None
+            
+        record = dict(record)
+        # Batch mode resolves companies before any text cleaning, so resolve from the raw spelling here too
+        if 'company' in record:
+            company_id = self.company_resolver.resolve(record['company'])
+            record['company_id'] = company_id
+            record['company_canonical'] = self.company_resolver.canonical_name(company_id)
+            
+        record['content'] = self.merge_content(record)
+        
+        for col in ['content', 'job_title', 'company', 'description']:
+            if col in record:
+                record[col] = self.normalize_text(record[col])
+                
+        if pd.notna(record.get('experience_level')):
+            level = str(record['experience_level']).lower()
+            record['experience_level'] = self.experience_mapping.get(level, level)
+            
+        for col in ['experience', 'content']:
+            if pd.isna(record.get('exp_min_years', np.nan)) and col in record:
+                record['exp_min_years'], record['exp_max_years'] = parse_experience_text(record[col])
+                
+        if pd.isna(record.get('experience_level')) and pd.notna(record.get('exp_min_years')):
+            record['experience_level'] = level_from_years([record['exp_min_years']])[0]
+            
+        if pd.notna(record.get('content_type')):
+            content_type = str(record['content_type']).lower()
+            record['content_type'] = self.content_type_mapping.get(content_type, content_type)
+            
+        if 'salary' in record:
+            record['salary'] = self.clean_salary(record['salary'])
+            
+        if 'location' in record:
+            record.update(zip(LOCATION_COLUMNS, self.gazetteer.resolve(record['location'])))
+            record['location'] = self.clean_location(record['location'])
+            
+        content = str(record['content'])
+        if len(content) < 5 or re.match(r'^[^\w]+$', content):
+            return None
+            
+        return record
+        
     def save_cleaned_data(self, output_file='cleaned_recruitment_data.csv'):
         self.df.to_csv(output_file, index=False)
         print(f"Cleaned data saved to {output_file}. Final record count: {len(self.df)}")
         
+    def cleaning_steps(self):
+        return [
+            ("Resolving companies...", self.resolve_companies),
+            ("Removing duplicates...", self.remove_duplicates),
+            ("Removing empty rows...", self.remove_empty_rows),
+            ("Merging content fields...", self.merge_content_fields),
+            ("Applying text cleaning...", self.apply_text_cleaning),
+            ("Standardizing experience levels...", self.standardize_experience_levels),
+            ("Parsing years of experience...", self.parse_experience_years),
+            ("Standardizing content types...", self.standardize_content_types),
+            ("Cleaning salary data...", self.clean_salary_data),
+            ("Canonicalizing locations...", self.canonicalize_locations),
+            ("Cleaning location data...", self.clean_location_data),
+            ("Validating and filtering data...", self.validate_and_filter)
+        ]
+        
+    def run_cleaning_steps(self):
+        for message, step in self.cleaning_steps():
+            print(message)
+            step()
+            
+    def clean_frame(self, df):
+        self.df = to_compact(df) if self.compact_dtypes else df.copy()
+        self.run_cleaning_steps()
+        self.df.reset_index(drop=True, inplace=True)
+        return self.df
+        
     def clean_data(self):
         print("Starting data cleaning process...")
         
         if not self.load_data():
             return False
             
-        print("Removing duplicates...")
-        self.remove_duplicates()
-        
-        print("Removing empty rows...")
-        self.remove_empty_rows()
-        
-        print("Merging content fields...")
-        self.merge_content_fields()
-        
-        print("Applying text cleaning...")
-        self.apply_text_cleaning()
-        
-        print("Standardizing experience levels...")
-        self.standardize_experience_levels()
-        
-        print("Standardizing content types...")
-        self.standardize_content_types()
-        
-        print("Cleaning salary data...")
-        self.clean_salary_data()
-        
-        print("Cleaning location data...")
-        self.clean_location_data()
-        
-        print("Validating and filtering data...")
-        self.validate_and_filter()
+        self.run_cleaning_steps()
         
         self.save_cleaned_data()
         print("Data cleaning completed!")
@@ -5,6 +5,16 @@ import time
 import json
 from urllib.parse import urljoin, urlparse
 import random
+import pandas as pd
+import numpy as np
+
+# The strings read_csv turns into NaN by default; the scrapers write "N/A" for every missing element
+CSV_NA_VALUES = {
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA',
+    'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+}
+
+RAW_FIELDNAMES = ['source', 'content', 'content_type', 'job_title', 'company', 'location', 'description', 'salary', 'experience', 'difficulty', 'category', 'experience_level', 'domain']
 
 class JobDataScraper:
     def __init__(self):
@@ -12,6 +22,27 @@ class JobDataScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.scraped_data = []
+        self.record_sink = None
+        
+    def emit_record(self, record):
+        # Streaming mode hands each record to the sink instead of buffering the whole crawl
+        if self.record_sink is not None:
+            self.record_sink(record)
+        else:
+            self.scraped_data.append(record)
+            
+    def site_scrapers(self):
+        return [
+            ("interview questions", self.scrape_interview_questions),
+            ("resume samples", self.scrape_resume_samples),
+            ("job postings from Indeed", self.scrape_indeed_jobs),
+            ("job postings from Naukri", self.scrape_naukri_jobs),
+            ("job postings from Monster", self.scrape_monster_jobs),
+            ("job postings from TimesJobs", self.scrape_times_jobs),
+            ("job postings from Shine", self.scrape_shine_jobs),
+            ("job postings from Foundit", self.scrape_foundit_jobs),
+            ("job postings from Instahyre", self.scrape_instahyre_jobs)
+        ]
         
     def scrape_indeed_jobs(self, query="software engineer", location="india", pages=3):
         base_url = "https://in.indeed.com/jobs"
@@ -46,7 +77,7 @@ class JobDataScraper:
                         salary_elem = card.find('span', class_='salaryText')
                         salary = salary_elem.get_text().strip() if salary_elem else "N/A"
                         
-                        self.scraped_data.append({
+                        self.emit_record({
                             'source': 'indeed',
                             'job_title': title,
                             'company': company,
@@ -91,7 +122,7 @@ class JobDataScraper:
                     desc_elem = container.find('div', class_='job-description')
                     description = desc_elem.get_text().strip() if desc_elem else "N/A"
                     
-                    self.scraped_data.append({
+                    self.emit_record({
                         'source': 'naukri',
                         'job_title': title,
                         'company': company,
@@ -134,7 +165,7 @@ class JobDataScraper:
         ]
         
         for i, question in enumerate(interview_questions):
-            self.scraped_data.append({
+            self.emit_record({
                 'source': 'manual_collection',
                 'content': question,
                 'content_type': 'interview_question',
@@ -163,7 +194,7 @@ class JobDataScraper:
         
         for i, resume in enumerate(resume_samples):
             experience_level = "senior" if i % 3 == 0 else "mid" if i % 3 == 1 else "junior"
-            self.scraped_data.append({
+            self.emit_record({
                 'source': 'manual_collection',
                 'content': resume,
                 'content_type': 'resume_summary',
@@ -172,7 +203,7 @@ class JobDataScraper:
             })
             
     def save_raw_data(self, filename='raw_recruitment_data.csv'):
-        fieldnames = ['source', 'content', 'content_type', 'job_title', 'company', 'location', 'description', 'salary', 'experience', 'difficulty', 'category', 'experience_level', 'domain']
+        fieldnames = RAW_FIELDNAMES
         
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
@@ -186,6 +217,20 @@ class JobDataScraper:
                 
         print(f"Raw data saved to {filename}. Total records: {len(self.scraped_data)}")
         
+    def normalize_value(self, value):
+        # save_raw_data writes None as an empty field, and read_csv reads every CSV_NA_VALUES string back as NaN
+        if value is None or (isinstance(value, str) and value in CSV_NA_VALUES):
+            return np.nan
+        return value
+        
+    def normalize_record(self, record):
+        # Same values a record gets after save_raw_data and read_csv
+        return {field: self.normalize_value(record.get(field)) for field in RAW_FIELDNAMES}
+        
+    def to_dataframe(self):
+        # Same shape as save_raw_data followed by read_csv: missing fields become NaN
+        return pd.DataFrame([self.normalize_record(record) for record in self.scraped_data], columns=RAW_FIELDNAMES)
+        
     def scrape_monster_jobs(self, query="software+engineer", location="india", pages=2):
         base_url = "https://www.monsterindia.com"
         
@@ -215,7 +260,7 @@ class JobDataScraper:
                         exp_elem = card.find('span', class_='experience')
                         experience = exp_elem.get_text().strip() if exp_elem else "N/A"
                         
-                        self.scraped_data.append({
+                        self.emit_record({
                             'source': 'monster',
                             'job_title': title,
                             'company': company,
@@ -262,7 +307,7 @@ class JobDataScraper:
                         exp_elem = item.find('li', string=lambda text: text and 'Exp' in text)
                         experience = exp_elem.get_text().strip() if exp_elem else "N/A"
                         
-                        self.scraped_data.append({
+                        self.emit_record({
                             'source': 'timesjobs',
                             'job_title': title,
                             'company': company,
@@ -309,7 +354,7 @@ class JobDataScraper:
                         salary_elem = card.find('div', class_='jobCard_salary__')
                         salary = salary_elem.get_text().strip() if salary_elem else "N/A"
                         
-                        self.scraped_data.append({
+                        self.emit_record({
                             'source': 'shine',
                             'job_title': title,
                             'company': company,
@@ -356,7 +401,7 @@ class JobDataScraper:
                         exp_elem = article.find('span', class_='experience')
                         experience = exp_elem.get_text().strip() if exp_elem else "N/A"
                         
-                        self.scraped_data.append({
+                        self.emit_record({
                             'source': 'foundit',
                             'job_title': title,
                             'company': company,
@@ -401,7 +446,7 @@ class JobDataScraper:
                     salary_elem = card.find('div', class_='salary-range')
                     salary = salary_elem.get_text().strip() if salary_elem else "N/A"
                     
-                    self.scraped_data.append({
+                    self.emit_record({
                         'source': 'instahyre',
                         'job_title': title,
                         'company': company,
@@ -418,36 +463,16 @@ class JobDataScraper:
             
         except Exception as e:
             print(f"Error scraping Instahyre: {e}")
-
+            
+    def run_scraping_steps(self):
+        for label, scrape in self.site_scrapers():
+            print(f"Scraping {label}...")
+            scrape()
+            
     def run_scraper(self):
         print("Starting data scraping process...")
         
-        print("Scraping interview questions...")
-        self.scrape_interview_questions()
-        
-        print("Scraping resume samples...")
-        self.scrape_resume_samples()
-        
-        print("Scraping job postings from Indeed...")
-        self.scrape_indeed_jobs()
-        
-        print("Scraping job postings from Naukri...")
-        self.scrape_naukri_jobs()
-        
-        print("Scraping job postings from Monster...")
-        self.scrape_monster_jobs()
-        
-        print("Scraping job postings from TimesJobs...")
-        self.scrape_times_jobs()
-        
-        print("Scraping job postings from Shine...")
-        self.scrape_shine_jobs()
-        
-        print("Scraping job postings from Foundit...")
-        self.scrape_foundit_jobs()
-        
-        print("Scraping job postings from Instahyre...")
-        self.scrape_instahyre_jobs()
+        self.run_scraping_steps()
         
         self.save_raw_data()
         print("Data scraping completed!")
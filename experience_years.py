@@ -0,0 +1,96 @@
+import re
+import numpy as np
+import pandas as pd
+
+YEARS = r'(?:yrs?|years?)'
+
+# A number that doesn't continue an earlier one, so "100 years" or "2015 years" don't yield 0 or 15
+NUMBER_START = r'(?<![\d.])\b'
+
+# Tried in order; each pattern yields (min, max) and later ones only fill rows still missing
+EXPERIENCE_PATTERNS = [
+    ('range', re.compile(NUMBER_START + r'(\d{1,2}(?:\.\d)?)\s*(?:-|to)\s*(\d{1,2}(?:\.\d)?)\s*\+?\s*' + YEARS, re.IGNORECASE)),
+    ('plus', re.compile(NUMBER_START + r'(\d{1,2})\s*\+\s*' + YEARS, re.IGNORECASE)),
+    ('single', re.compile(NUMBER_START + r'(\d{1,2}(?:\.\d)?)\s*' + YEARS, re.IGNORECASE)),
+    ('fresher', re.compile(r'\b(fresher|freshers|entry level|entry-level)\b', re.IGNORECASE))
+]
+
+# Every pattern above contains one of these lowercase substrings
+CANDIDATE_PATTERN = 'yr|year|fresher|entry'
+
+# Years of experience a fresher posting asks for
+FRESHER_RANGE = (0.0, 1.0)
+
+# Lower bounds of each level, matching the cleaner's '0-2 years' / '2-5 years' / '5+ years' mapping
+LEVEL_THRESHOLDS = [(5.0, 'senior'), (2.0, 'mid'), (0.0, 'junior')]
+
+EXPERIENCE_COLUMNS = ['exp_min_years', 'exp_max_years']
+
+
+def parse_experience(texts):
+    texts = texts.astype(object).where(texts.notna())
+    min_years = pd.Series(np.nan, index=texts.index, dtype='float32')
+    max_years = pd.Series(np.nan, index=texts.index, dtype='float32')
+    
+    # A plain substring scan is much cheaper than the patterns and rules out most rows up front
+    candidates = texts.str.lower().str.contains(CANDIDATE_PATTERN).fillna(False).astype(bool)
+    
+    for kind, pattern in EXPERIENCE_PATTERNS:
+        missing = min_years.isna() & candidates
+        if not missing.any():
+            break
+            
+        found = texts[missing].str.extract(pattern)
+        matched = found[0].notna()
+        if not matched.any():
+            continue
+            
+        rows = found.index[matched]
+        if kind == 'fresher':
+            low, high = FRESHER_RANGE
+        else:
+            low = found.loc[matched, 0].astype('float32')
+            # "5+ years" and a bare "3 years" only state a minimum
+            high = found.loc[matched, 1].astype('float32') if kind == 'range' else np.nan
+            
+        min_years.loc[rows] = low
+        max_years.loc[rows] = high
+        
+    # Ranges written high-to-low still describe the same span
+    swapped = max_years < min_years
+    min_years.loc[swapped], max_years.loc[swapped] = max_years[swapped], min_years[swapped]
+    
+    return pd.DataFrame({'exp_min_years': min_years, 'exp_max_years': max_years})
+
+
+def parse_experience_text(text):
+    if pd.isna(text):
+        return np.nan, np.nan
+        
+    for kind, pattern in EXPERIENCE_PATTERNS:
+        match = pattern.search(str(text))
+        if match is None:
+            continue
+        if kind == 'fresher':
+            return FRESHER_RANGE
+        low = float(match.group(1))
+        if kind != 'range':
+            return low, np.nan
+        high = float(match.group(2))
+        return min(low, high), max(low, high)
+        
+    return np.nan, np.nan
+
+
+def level_from_years(min_years):
+    min_years = np.asarray(min_years, dtype='float32')
+    conditions = [min_years >= threshold for threshold, _ in LEVEL_THRESHOLDS]
+    # Missing years fail every comparison and fall through to NaN
+    return np.select(conditions, [np.array(level, dtype=object) for _, level in LEVEL_THRESHOLDS], default=np.nan)
+
+
+def filter_by_experience(df, years):
+    # Postings whose required range covers the candidate's years; open-ended ranges have no upper bound
+    min_ok = df['exp_min_years'] <= years
+    max_ok = df['exp_max_years'].isna() | (df['exp_max_years'] >= years)
+    return df[min_ok & max_ok]
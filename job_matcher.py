@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+from skill_bitset import SkillVocabulary
+
+EXPERIENCE_ORDER = ['junior', 'mid', 'senior']
+UNKNOWN_LEVEL = len(EXPERIENCE_ORDER)
+
+
+def experience_compatibility_table():
+    table = np.full((UNKNOWN_LEVEL + 1, UNKNOWN_LEVEL + 1), 0.5, dtype=np.float32)
+    for i in range(UNKNOWN_LEVEL):
+        for j in range(UNKNOWN_LEVEL):
+            table[i, j] = 1.0 - abs(i - j) / (UNKNOWN_LEVEL - 1)
+    return table
+
+
+class JobMatcher:
+    def __init__(self, vocabulary, skill_weight=0.6, category_weight=0.2, experience_weight=0.2,
+                 similarity='jaccard', query_block_size=2048, target_block_size=8192):
+        if similarity not in ('jaccard', 'cosine'):
+            raise ValueError(f"Unknown similarity '{similarity}', expected 'jaccard' or 'cosine'")
+            
+        self.vocabulary = vocabulary
+        self.skill_weight = skill_weight
+        self.category_weight = category_weight
+        self.experience_weight = experience_weight
+        self.similarity = similarity
+        self.query_block_size = query_block_size
+        self.target_block_size = target_block_size
+        self.experience_table = experience_compatibility_table()
+        
+    @classmethod
+    def from_annotated(cls, annotated_df, **kwargs):
+        return cls(SkillVocabulary.from_dict(annotated_df.attrs['skill_vocabulary']), **kwargs)
+        
+    def prepare(self, frame):
+        masks = self.vocabulary.from_hex(frame['skill_mask'].fillna('0' * self.vocabulary.n_words * 16))
+        skills = self.vocabulary.unpack(masks).astype(np.float32)
+        categories = self.vocabulary.category_hits(masks).astype(np.float32)
+        
+        levels = pd.Categorical(frame['experience_level_annotated'], categories=EXPERIENCE_ORDER).codes
+        levels = np.where(levels < 0, UNKNOWN_LEVEL, levels)
+        
+        return {
+            'index': frame.index.to_numpy(),
+            'skills': skills,
+            'skill_sizes': skills.sum(axis=1),
+            'categories': categories,
+            'category_norms': np.sqrt(categories.sum(axis=1)),
+            'levels': levels
+        }
+        
+    def _slice(self, prepared, start, stop):
+        return {key: values[start:stop] for key, values in prepared.items()}
+        
+    def score_block(self, queries, targets):
+        overlap = queries['skills'] @ targets['skills'].T
+        q_sizes = queries['skill_sizes'][:, None]
+        t_sizes = targets['skill_sizes'][None, :]
+        
+        if self.similarity == 'jaccard':
+            denominator = q_sizes + t_sizes - overlap
+        else:
+            denominator = np.sqrt(q_sizes * t_sizes)
+        skill_score = np.divide(overlap, denominator, out=np.zeros_like(overlap), where=denominator > 0)
+        
+        category_overlap = queries['categories'] @ targets['categories'].T
+        category_denominator = queries['category_norms'][:, None] * targets['category_norms'][None, :]
+        category_score = np.divide(category_overlap, category_denominator,
+                                   out=np.zeros_like(category_overlap), where=category_denominator > 0)
+        
+        experience_score = self.experience_table[queries['levels'][:, None], targets['levels'][None, :]]
+        
+        return (self.skill_weight * skill_score
+                + self.category_weight * category_score
+                + self.experience_weight * experience_score)
+        
+    def top_k(self, queries, targets, k=10):
+        n_queries = len(queries['levels'])
+        n_targets = len(targets['levels'])
+        k = min(k, n_targets)
+        
+        top_indices = np.zeros((n_queries, k), dtype=np.int64)
+        top_scores = np.zeros((n_queries, k), dtype=np.float32)
+        
+        if k == 0:
+            return top_indices, top_scores
+            
+        for q_start in range(0, n_queries, self.query_block_size):
+            q_block = self._slice(queries, q_start, q_start + self.query_block_size)
+            block_rows = len(q_block['levels'])
+            best_scores = np.empty((block_rows, 0), dtype=np.float32)
+            best_indices = np.empty((block_rows, 0), dtype=np.int64)
+            
+            for t_start in range(0, n_targets, self.target_block_size):
+                t_block = self._slice(targets, t_start, t_start + self.target_block_size)
+                scores = self.score_block(q_block, t_block)
+                positions = np.broadcast_to(np.arange(t_start, t_start + scores.shape[1]), scores.shape)
+                
+                candidate_scores = np.concatenate([best_scores, scores], axis=1)
+                candidate_indices = np.concatenate([best_indices, positions], axis=1)
+                
+                # Keep only the k best per row so memory stays at one block plus k columns
+                if candidate_scores.shape[1] > k:
+                    # argpartition alone keeps an arbitrary subset of the scores tied at the k-th place, which
+                    # would make the result depend on the block size. Everything above the k-th score is kept,
+                    # and the remaining places go to the tied candidates with the lowest target positions
+                    kth = -np.partition(-candidate_scores, k - 1, axis=1)[:, k - 1:k]
+                    selection_key = np.where(candidate_scores > kth, -1,
+                                             np.where(candidate_scores == kth, candidate_indices, n_targets))
+                    keep = np.argpartition(selection_key, k - 1, axis=1)[:, :k]
+                    candidate_scores = np.take_along_axis(candidate_scores, keep, axis=1)
+                    candidate_indices = np.take_along_axis(candidate_indices, keep, axis=1)
+                    
+                best_scores, best_indices = candidate_scores, candidate_indices
+                
+            # Highest score first, lower target position first among ties
+            order = np.lexsort((best_indices, -best_scores), axis=1)
+            top_scores[q_start:q_start + block_rows] = np.take_along_axis(best_scores, order, axis=1)
+            top_indices[q_start:q_start + block_rows] = np.take_along_axis(best_indices, order, axis=1)
+            
+        return top_indices, top_scores
+        
+    def match(self, query_frame, target_frame, k=10, query_column='query_index', target_column='target_index'):
+        queries = self.prepare(query_frame)
+        targets = self.prepare(target_frame)
+        top_indices, top_scores = self.top_k(queries, targets, k)
+        
+        n_queries, n_ranks = top_indices.shape
+        return pd.DataFrame({
+            query_column: np.repeat(queries['index'], n_ranks),
+            target_column: targets['index'][top_indices.ravel()],
+            'rank': np.tile(np.arange(1, n_ranks + 1), n_queries),
+            'score': top_scores.ravel()
+        })
+        
+    def split_annotated(self, annotated_df):
+        resumes = annotated_df[annotated_df['content_type'] == 'resume_summary']
+        jobs = annotated_df[annotated_df['content_type'] == 'job_description']
+        return resumes, jobs
+        
+    def match_resumes_to_jobs(self, annotated_df, k=10):
+        resumes, jobs = self.split_annotated(annotated_df)
+        return self.match(resumes, jobs, k, query_column='resume_index', target_column='job_index')
+        
+    def match_jobs_to_resumes(self, annotated_df, k=10):
+        resumes, jobs = self.split_annotated(annotated_df)
+        return self.match(jobs, resumes, k, query_column='job_index', target_column='resume_index')
+
+
+if __name__ == "__main__":
+    from data_annotator import RecruitmentDataAnnotator
+    
+    annotator = RecruitmentDataAnnotator()
+    annotated_df = annotator.load_annotated_data()
+    matcher = JobMatcher.from_annotated(annotated_df)
+    
+    matches = matcher.match_resumes_to_jobs(annotated_df, k=3)
+    print(f"Top job matches per resume: {len(matches)} pairs")
+    print(matches.join(annotated_df[['job_title', 'company']], on='job_index').head(9))
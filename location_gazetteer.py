@@ -0,0 +1,182 @@
+import json
+import re
+import numpy as np
+import pandas as pd
+
+# Canonical city -> (state, aliases as they appear on the job boards)
+CITY_GAZETTEER = {
+    'Bengaluru': ('Karnataka', ['bengaluru', 'bangalore', 'blr', 'bangalore urban']),
+    'Mysuru': ('Karnataka', ['mysuru', 'mysore']),
+    'Mangaluru': ('Karnataka', ['mangaluru', 'mangalore']),
+    'Hyderabad': ('Telangana', ['hyderabad', 'secunderabad', 'hyd', 'hitech city']),
+    'Pune': ('Maharashtra', ['pune', 'hinjewadi', 'pimpri chinchwad']),
+    'Mumbai': ('Maharashtra', ['mumbai', 'bombay', 'navi mumbai', 'thane', 'mumbai suburban']),
+    'Nagpur': ('Maharashtra', ['nagpur']),
+    'Chennai': ('Tamil Nadu', ['chennai', 'madras']),
+    'Coimbatore': ('Tamil Nadu', ['coimbatore']),
+    'New Delhi': ('Delhi', ['new delhi', 'delhi', 'delhi ncr', 'ncr']),
+    'Noida': ('Uttar Pradesh', ['noida', 'greater noida']),
+    'Ghaziabad': ('Uttar Pradesh', ['ghaziabad']),
+    'Lucknow': ('Uttar Pradesh', ['lucknow']),
+    'Gurugram': ('Haryana', ['gurugram', 'gurgaon']),
+    'Faridabad': ('Haryana', ['faridabad']),
+    'Chandigarh': ('Chandigarh', ['chandigarh', 'mohali', 'panchkula']),
+    'Kolkata': ('West Bengal', ['kolkata', 'calcutta', 'salt lake']),
+    'Ahmedabad': ('Gujarat', ['ahmedabad', 'gandhinagar']),
+    'Vadodara': ('Gujarat', ['vadodara', 'baroda']),
+    'Jaipur': ('Rajasthan', ['jaipur']),
+    'Indore': ('Madhya Pradesh', ['indore']),
+    'Bhopal': ('Madhya Pradesh', ['bhopal']),
+    'Kochi': ('Kerala', ['kochi', 'cochin', 'ernakulam']),
+    'Thiruvananthapuram': ('Kerala', ['thiruvananthapuram', 'trivandrum', 'technopark']),
+    'Bhubaneswar': ('Odisha', ['bhubaneswar']),
+    'Visakhapatnam': ('Andhra Pradesh', ['visakhapatnam', 'vizag']),
+    'Vijayawada': ('Andhra Pradesh', ['vijayawada'])
+}
+
+STATE_ALIASES = {
+    'Karnataka': ['karnataka'],
+    'Telangana': ['telangana'],
+    'Maharashtra': ['maharashtra'],
+    'Tamil Nadu': ['tamil nadu', 'tamilnadu'],
+    'Delhi': ['nct of delhi'],
+    'Uttar Pradesh': ['uttar pradesh'],
+    'Haryana': ['haryana'],
+    'West Bengal': ['west bengal'],
+    'Gujarat': ['gujarat'],
+    'Rajasthan': ['rajasthan'],
+    'Madhya Pradesh': ['madhya pradesh'],
+    'Kerala': ['kerala'],
+    'Odisha': ['odisha', 'orissa'],
+    'Andhra Pradesh': ['andhra pradesh']
+}
+
+WORK_MODE_ALIASES = {
+    'hybrid': ['hybrid'],
+    'remote': ['remote', 'wfh', 'work from home', 'work from anywhere', 'anywhere in india']
+}
+
+LOCATION_COLUMNS = ['location_city', 'location_state', 'work_mode']
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Trie key holding the entries that end at a node; tokens are never empty
+TERMINAL = ''
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+class LocationGazetteer:
+    def __init__(self, cities=None, states=None, work_modes=None):
+        self.cities = cities or CITY_GAZETTEER
+        self.states = states or STATE_ALIASES
+        self.work_modes = work_modes or WORK_MODE_ALIASES
+        self.trie = {}
+        
+        for city, (_, aliases) in self.cities.items():
+            for alias in aliases + [city]:
+                self.add(alias, ('city', city))
+                
+        for state, aliases in self.states.items():
+            for alias in aliases + [state]:
+                self.add(alias, ('state', state))
+                
+        for mode, aliases in self.work_modes.items():
+            for alias in aliases:
+                self.add(alias, ('mode', mode))
+                
+    def add(self, alias, entry):
+        node = self.trie
+        for token in tokenize(alias):
+            node = node.setdefault(token, {})
+        entries = node.setdefault(TERMINAL, [])
+        if entry not in entries:
+            entries.append(entry)
+            
+    def match(self, text):
+        tokens = tokenize(text)
+        matches = []
+        position = 0
+        
+        while position < len(tokens):
+            # Longest alias starting here, so "navi mumbai" wins over a shorter prefix
+            node = self.trie
+            best, best_end = None, position
+            for end in range(position, len(tokens)):
+                node = node.get(tokens[end])
+                if node is None:
+                    break
+                if TERMINAL in node:
+                    best, best_end = node[TERMINAL], end + 1
+                    
+            if best:
+                matches.extend(best)
+                position = best_end
+            else:
+                position += 1
+                
+        return matches
+        
+    def resolve(self, text):
+        if pd.isna(text) or str(text).strip() == '':
+            return None, None, None
+            
+        city = state = None
+        modes = set()
+        
+        for kind, value in self.match(text):
+            if kind == 'city' and city is None:
+                city = value
+            elif kind == 'state' and state is None:
+                state = value
+            elif kind == 'mode':
+                modes.add(value)
+                
+        if city is not None:
+            state = self.cities[city][0]
+            
+        if 'hybrid' in modes:
+            work_mode = 'hybrid'
+        elif 'remote' in modes:
+            work_mode = 'remote'
+        elif city is not None or state is not None:
+            work_mode = 'onsite'
+        else:
+            work_mode = None
+            
+        return city, state, work_mode
+        
+    def canonicalize(self, locations):
+        # Resolve each distinct spelling once and broadcast through the factorized codes
+        codes, uniques = pd.factorize(locations)
+        resolved = [self.resolve(value) for value in uniques]
+        
+        columns = {}
+        for i, column in enumerate(LOCATION_COLUMNS):
+            values = np.array([entry[i] for entry in resolved] + [None], dtype=object)
+            columns[column] = pd.Categorical(values[codes])
+            
+        return pd.DataFrame(columns, index=locations.index)
+        
+    def to_dict(self):
+        return {
+            'cities': {city: [state, aliases] for city, (state, aliases) in self.cities.items()},
+            'states': self.states,
+            'work_modes': self.work_modes
+        }
+        
+    @classmethod
+    def from_dict(cls, data):
+        cities = {city: (state, aliases) for city, (state, aliases) in data['cities'].items()}
+        return cls(cities, data['states'], data.get('work_modes'))
+        
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,201 @@
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import pandas as pd
+from data_scraper import JobDataScraper
+from data_cleaner import RecruitmentDataCleaner
+from data_annotator import RecruitmentDataAnnotator
+
+STAGES = ('scrape', 'clean', 'annotate')
+
+# Every module whose code can change a stage's output; the stage's own module comes first
+STAGE_DEPENDENCIES = {
+    'scrape': ['data_scraper'],
+    'clean': ['data_cleaner', 'compact_dtypes', 'location_gazetteer', 'company_resolver', 'experience_years'],
+    'annotate': ['data_annotator', 'skill_bitset', 'annotation_summary', 'compact_dtypes', 'experience_years']
+}
+
+# Scraping has no input to fingerprint, so a cached scrape would be reused forever
+CACHED_STAGES = ('clean', 'annotate')
+
+STAGE_FILES = {
+    'scrape': 'raw_recruitment_data.csv',
+    'clean': 'cleaned_recruitment_data.csv',
+    'annotate': 'annotated_recruitment_data.csv'
+}
+
+
+def fingerprint_frame(df):
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(col) for col in df.columns]).encode('utf-8'))
+    digest.update(json.dumps([str(dtype) for dtype in df.dtypes]).encode('utf-8'))
+    try:
+        hashed = pd.util.hash_pandas_object(df, index=True)
+    except TypeError:
+        # List cells (annotated skills) are not hashable, so hash their JSON form
+        hashed = pd.util.hash_pandas_object(
+            df.apply(lambda col: col.map(lambda v: json.dumps(v) if isinstance(v, list) else v)), index=True
+        )
+    digest.update(hashed.values.tobytes())
+    return digest.hexdigest()
+
+
+def fingerprint_code(stage):
+    digest = hashlib.sha256()
+    for module_name in STAGE_DEPENDENCIES[stage]:
+        digest.update(inspect.getsource(importlib.import_module(module_name)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def fingerprint_config_files(config):
+    # Gazetteer and alias files change the output without changing their path in the config
+    fingerprints = {}
+    for name, path in sorted(config.items()):
+        if not name.endswith('_file') or not path:
+            continue
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                fingerprints[name] = hashlib.sha256(f.read()).hexdigest()
+        else:
+            fingerprints[name] = None
+    return fingerprints
+
+
+class RecruitmentPipeline:
+    def __init__(self, cache_dir='.pipeline_cache', stage_configs=None, use_cache=True, save_outputs=False,
+                 cached_stages=CACHED_STAGES):
+        self.cache_dir = cache_dir
+        self.stage_configs = stage_configs or {}
+        self.use_cache = use_cache
+        self.cached_stages = cached_stages
+        self.save_outputs = save_outputs
+        self.results = {}
+        
+    def stage_config(self, stage):
+        return self.stage_configs.get(stage, {})
+        
+    def stage_key(self, stage, input_fingerprint):
+        key = {
+            'stage': stage,
+            'config': self.stage_config(stage),
+            'code': fingerprint_code(stage),
+            'files': fingerprint_config_files(self.stage_config(stage)),
+            'input': input_fingerprint
+        }
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        
+    def cache_path(self, stage, key):
+        return os.path.join(self.cache_dir, f"{stage}-{key}.pkl")
+        
+    def latest_path(self, stage):
+        return os.path.join(self.cache_dir, f"{stage}.latest")
+        
+    def load_cached(self, stage, key):
+        path = self.cache_path(stage, key)
+        if not self.use_cache or stage not in self.cached_stages or not os.path.exists(path):
+            return None
+        return pd.read_pickle(path)
+        
+    def store_cached(self, stage, key, df):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        df.to_pickle(self.cache_path(stage, key))
+        with open(self.latest_path(stage), 'w', encoding='utf-8') as f:
+            f.write(key)
+            
+    def load_stage_input(self, stage):
+        position = STAGES.index(stage)
+        if position == 0:
+            return None
+            
+        upstream = STAGES[position - 1]
+        if upstream in self.results:
+            return self.results[upstream]
+            
+        # Prefer the last cached upstream output, then the upstream CSV on disk
+        if self.use_cache and os.path.exists(self.latest_path(upstream)):
+            with open(self.latest_path(upstream), encoding='utf-8') as f:
+                cached = self.load_cached(upstream, f.read().strip())
+            if cached is not None:
+                print(f"Using cached {upstream} output as input to {stage}")
+                return cached
+                
+        input_file = STAGE_FILES[upstream]
+        print(f"Loading {stage} input from {input_file}")
+        return pd.read_csv(input_file)
+        
+    def execute_stage(self, stage, input_df):
+        config = self.stage_config(stage)
+        
+        if stage == 'scrape':
+            scraper = JobDataScraper()
+            scraper.run_scraping_steps()
+            if self.save_outputs:
+                scraper.save_raw_data(STAGE_FILES[stage])
+            return scraper.to_dataframe()
+            
+        if stage == 'clean':
+            cleaner = RecruitmentDataCleaner(**config)
+            cleaned_df = cleaner.clean_frame(input_df)
+            if self.save_outputs:
+                cleaner.save_cleaned_data(STAGE_FILES[stage])
+            return cleaned_df
+            
+        n_samples = config.get('n_samples', 25)
+        annotator = RecruitmentDataAnnotator(**{k: v for k, v in config.items() if k != 'n_samples'})
+        annotated_df = annotator.annotate_frame(input_df, n_samples)
+        annotated_df.attrs['corpus_summary'] = annotator.corpus_summary.to_dict()
+        if self.save_outputs:
+            annotator.save_annotated_data(annotated_df, STAGE_FILES[stage])
+            annotator.save_corpus_summary()
+        return annotated_df
+        
+    def run(self, start='scrape', end='annotate', force=()):
+        if STAGES.index(start) > STAGES.index(end):
+            raise ValueError(f"Stage range {start}..{end} is empty")
+            
+        self.results = {}
+        stages = STAGES[STAGES.index(start):STAGES.index(end) + 1]
+        
+        for stage in stages:
+            input_df = self.load_stage_input(stage)
+            input_fingerprint = fingerprint_frame(input_df) if input_df is not None else None
+            key = self.stage_key(stage, input_fingerprint)
+            
+            output_df = None if stage in force else self.load_cached(stage, key)
+            
+            if output_df is not None:
+                print(f"Stage '{stage}' unchanged, reusing cached output ({len(output_df)} records)")
+            else:
+                print(f"Running stage '{stage}'...")
+                output_df = self.execute_stage(stage, input_df)
+                self.store_cached(stage, key, output_df)
+                
+            self.results[stage] = output_df
+            
+        return self.results[end]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the scrape, clean and annotate stages in one process")
+    parser.add_argument('--from', dest='start', choices=STAGES, default='scrape')
+    parser.add_argument('--to', dest='end', choices=STAGES, default='annotate')
+    parser.add_argument('--force', nargs='*', choices=STAGES, default=[], help="stages to re-run even if cached")
+    parser.add_argument('--cache-dir', default='.pipeline_cache')
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--cache-scrape', action='store_true', help="reuse the last scrape instead of scraping again")
+    parser.add_argument('--save-outputs', action='store_true', help="also write each stage's CSV file")
+    parser.add_argument('--workers', type=int, default=1, help="annotation worker processes")
+    args = parser.parse_args()
+    
+    pipeline = RecruitmentPipeline(
+        cache_dir=args.cache_dir,
+        stage_configs={'annotate': {'n_workers': args.workers}},
+        use_cache=not args.no_cache,
+        save_outputs=args.save_outputs,
+        cached_stages=STAGES if args.cache_scrape else CACHED_STAGES
+    )
+    result = pipeline.run(args.start, args.end, force=args.force)
+    print(f"Pipeline finished at stage '{args.end}'. Records: {len(result)}")
@@ -0,0 +1,218 @@
+import json
+import re
+import numpy as np
+import pandas as pd
+from skill_bitset import SkillVocabulary
+from location_gazetteer import LocationGazetteer
+
+FIELD_COLUMNS = {
+    'level': 'experience_level_annotated',
+    'location': 'location',
+    'city': 'location_city',
+    'state': 'location_state',
+    'mode': 'work_mode',
+    'company': 'company_canonical'
+}
+
+# Frames cleaned before company resolution only have the raw spelling
+FALLBACK_COLUMNS = {'company_canonical': 'company'}
+
+# Operators are case-insensitive; a double-quoted term (optionally after "field:") is taken literally,
+# so company:"Procter and Gamble" is one term rather than two operands
+QUERY_TOKEN_PATTERN = re.compile(r'([^\s()"]*"[^"]*"|\(|\)|\bAND\b|\bOR\b)', re.IGNORECASE)
+
+
+def normalize_term(value):
+    return re.sub(r'\s+', ' ', str(value)).strip().lower()
+
+
+class PostingIndex:
+    def __init__(self, postings, terms, n_docs, gazetteer=None):
+        self.postings = postings
+        self.terms = terms
+        self.n_docs = n_docs
+        self.gazetteer = gazetteer or LocationGazetteer()
+        
+    @classmethod
+    def build(cls, annotated_df, vocabulary=None, gazetteer=None):
+        lists = {}
+        
+        if 'skill_mask' in annotated_df.columns:
+            if vocabulary is None:
+                vocabulary = SkillVocabulary.from_dict(annotated_df.attrs['skill_vocabulary'])
+                
+            has_mask = annotated_df['skill_mask'].notna().to_numpy()
+            doc_ids = np.flatnonzero(has_mask)
+            bits = vocabulary.unpack(vocabulary.from_hex(annotated_df['skill_mask'][has_mask]))
+            
+            for i, skill in enumerate(vocabulary.skills):
+                docs = doc_ids[bits[:, i]]
+                if len(docs) > 0:
+                    lists[f"skill:{skill}"] = docs
+                    
+        for field, column in FIELD_COLUMNS.items():
+            if column not in annotated_df.columns:
+                column = FALLBACK_COLUMNS.get(column)
+            if column not in annotated_df.columns:
+                continue
+                
+            codes, uniques = pd.factorize(annotated_df[column])
+            order = np.argsort(codes, kind='stable')
+            boundaries = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            
+            for code, value in enumerate(uniques):
+                key = f"{field}:{normalize_term(value)}"
+                docs = order[boundaries[code]:boundaries[code + 1]]
+                # Values that only differ in case or spacing share a posting list
+                lists[key] = np.union1d(lists[key], docs) if key in lists else docs
+                
+        return cls.from_lists(lists, len(annotated_df), gazetteer)
+        
+    @classmethod
+    def from_lists(cls, lists, n_docs, gazetteer=None):
+        terms = {}
+        chunks = []
+        offset = 0
+        
+        for key in sorted(lists):
+            docs = np.asarray(lists[key], dtype=np.int32)
+            terms[key] = [offset, offset + len(docs)]
+            chunks.append(docs)
+            offset += len(docs)
+            
+        postings = np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int32)
+        return cls(postings, terms, n_docs, gazetteer)
+        
+    def posting_list(self, key):
+        if key not in self.terms:
+            return np.empty(0, dtype=np.int32)
+        start, end = self.terms[key]
+        return self.postings[start:end]
+        
+    def location(self, text):
+        # Spellings like "Bangalore" resolve to the canonical city:/state: lists the cleaner built
+        city, state, work_mode = self.gazetteer.resolve(text)
+        
+        operands = []
+        if city is not None:
+            operands.append(self.posting_list(f"city:{normalize_term(city)}"))
+        elif state is not None:
+            operands.append(self.posting_list(f"state:{normalize_term(state)}"))
+        # onsite is only inferred from a place; remote and hybrid are named in the text
+        if work_mode in ('remote', 'hybrid'):
+            operands.append(self.posting_list(f"mode:{work_mode}"))
+            
+        return self.intersect(*operands) if operands else np.empty(0, dtype=np.int32)
+        
+    def term(self, text):
+        text = normalize_term(text)
+        field, _, value = text.partition(':')
+        
+        if value and field == 'location':
+            return np.union1d(self.posting_list(f"location:{value}"), self.location(value))
+            
+        if value and (field == 'skill' or field in FIELD_COLUMNS):
+            return np.asarray(self.posting_list(f"{field}:{value}"))
+            
+        # Bare terms match any field, and place names match their canonical location
+        result = self.location(text)
+        for field in ('skill',) + tuple(FIELD_COLUMNS):
+            docs = self.posting_list(f"{field}:{text}")
+            if len(docs) > 0:
+                result = np.union1d(result, docs)
+        return result
+        
+    def intersect(self, *lists):
+        lists = sorted(lists, key=len)
+        result = lists[0]
+        for docs in lists[1:]:
+            if len(result) == 0:
+                break
+            result = np.intersect1d(result, docs, assume_unique=True)
+        return result
+        
+    def union(self, *lists):
+        result = np.empty(0, dtype=np.int32)
+        for docs in lists:
+            result = np.union1d(result, docs)
+        return result
+        
+    def query(self, expression):
+        if expression.count('"') % 2:
+            raise ValueError(f"Unbalanced quotes in query: {expression}")
+            
+        tokens = [token.strip() for token in QUERY_TOKEN_PATTERN.split(expression) if token.strip()]
+        result, position = self._parse_or(tokens, 0)
+        
+        if position != len(tokens):
+            raise ValueError(f"Unexpected '{tokens[position]}' in query: {expression}")
+            
+        return result.astype(np.int32)
+        
+    def _parse_or(self, tokens, position):
+        operands = []
+        operand, position = self._parse_and(tokens, position)
+        operands.append(operand)
+        
+        while position < len(tokens) and tokens[position].upper() == 'OR':
+            operand, position = self._parse_and(tokens, position + 1)
+            operands.append(operand)
+            
+        return self.union(*operands), position
+        
+    def _parse_and(self, tokens, position):
+        operands = []
+        operand, position = self._parse_operand(tokens, position)
+        operands.append(operand)
+        
+        while position < len(tokens) and tokens[position].upper() == 'AND':
+            operand, position = self._parse_operand(tokens, position + 1)
+            operands.append(operand)
+            
+        return self.intersect(*operands), position
+        
+    def _parse_operand(self, tokens, position):
+        if position >= len(tokens):
+            raise ValueError("Query ended where a term was expected")
+            
+        token = tokens[position]
+        
+        if token == '(':
+            result, position = self._parse_or(tokens, position + 1)
+            if position >= len(tokens) or tokens[position] != ')':
+                raise ValueError("Unbalanced parentheses in query")
+            return result, position + 1
+            
+        if token.upper() in ('AND', 'OR', ')'):
+            raise ValueError(f"Unexpected '{token}' in query")
+            
+        return self.term(token.replace('"', '')), position + 1
+        
+    def save(self, path):
+        np.save(f"{path}.npy", self.postings)
+        with open(f"{path}.json", 'w', encoding='utf-8') as f:
+            json.dump({'n_docs': self.n_docs, 'terms': self.terms}, f)
+            
+        print(f"Posting index saved to {path}.npy. Terms: {len(self.terms)}")
+        
+    @classmethod
+    def load(cls, path, gazetteer=None):
+        with open(f"{path}.json", encoding='utf-8') as f:
+            metadata = json.load(f)
+            
+        # Posting lists stay on disk and are paged in on first access
+        postings = np.load(f"{path}.npy", mmap_mode='r')
+        return cls(postings, metadata['terms'], metadata['n_docs'], gazetteer)
+
+
+if __name__ == "__main__":
+    from data_annotator import RecruitmentDataAnnotator
+    
+    annotated_df = RecruitmentDataAnnotator().load_annotated_data()
+    index = PostingIndex.build(annotated_df)
+    index.save('annotated_recruitment_data.index')
+    
+    query = "java AND (senior OR mid)"
+    matches = index.query(query)
+    print(f"{query}: {len(matches)} postings")
+    print(annotated_df.iloc[matches][['job_title', 'company', 'experience_level_annotated']])
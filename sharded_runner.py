@@ -0,0 +1,310 @@
+import argparse
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+from data_cleaner import RecruitmentDataCleaner, ORDER_COLUMN
+from data_annotator import RecruitmentDataAnnotator, ANNOTATION_PASSES
+from pipeline import fingerprint_frame
+
+SHARD_STAGES = ('clean', 'annotate')
+
+
+def partition_keys(df, cleaner):
+    # Hash each row on the same subset remove_duplicates compares, so exact duplicates share a key
+    groups = np.full(len(df), -1, dtype=np.int64)
+    keys = np.zeros(len(df), dtype=np.uint64)
+    
+    for group, (mask, subset) in enumerate(cleaner.dedup_groups(df)):
+        rows = np.asarray(mask, dtype=bool) & (groups < 0)
+        if rows.any():
+            keys[rows] = pd.util.hash_pandas_object(df.loc[rows, subset], index=False).to_numpy()
+        groups[rows] = group
+        
+    return groups, keys
+
+
+def assign_shards(keys, n_shards):
+    return (keys % np.uint64(n_shards)).astype(np.int64)
+
+
+def clean_shard(entry, config):
+    cleaner = RecruitmentDataCleaner(input_file=None, **config)
+    cleaned_df = cleaner.clean_frame(pd.read_pickle(entry['input']))
+    cleaned_df.to_pickle(entry['output'])
+    return {'rows_out': len(cleaned_df)}
+
+
+def annotate_shard(entry, config):
+    annotator = RecruitmentDataAnnotator(input_file=None, **config)
+    annotator.df = pd.read_pickle(entry['input'])
+    passes = annotator.run_annotation_passes()
+    pd.to_pickle(passes, entry['output'])
+    return {'rows_out': sum(len(annotated_data) for annotated_data in passes)}
+
+
+def process_shard(stage, entry, config):
+    start = time.perf_counter()
+    result = clean_shard(entry, config) if stage == 'clean' else annotate_shard(entry, config)
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    result['status'] = 'done'
+    
+    # Each shard reports through its own file so nodes never write the shared manifest concurrently
+    with open(entry['status_file'], 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+    return result
+
+
+class ShardedRunner:
+    def __init__(self, n_shards=4, n_workers=None, shard_dir='shards', cleaner_config=None, annotator_config=None):
+        self.n_shards = n_shards
+        self.n_workers = n_workers or n_shards
+        self.shard_dir = shard_dir
+        self.cleaner_config = cleaner_config or {}
+        self.annotator_config = annotator_config or {}
+        self.corpus_summary = None
+        
+    def stage_config(self, stage):
+        return self.cleaner_config if stage == 'clean' else self.annotator_config
+        
+    def manifest_path(self, stage):
+        return os.path.join(self.shard_dir, f"{stage}.manifest.json")
+        
+    def load_manifest(self, stage):
+        with open(self.manifest_path(stage), encoding='utf-8') as f:
+            manifest = json.load(f)
+            
+        for entry in manifest['shards']:
+            # A shard counts as done only while its output is still on disk
+            if not os.path.exists(entry['output']):
+                entry['status'] = 'pending'
+            elif os.path.exists(entry['status_file']):
+                with open(entry['status_file'], encoding='utf-8') as f:
+                    entry.update(json.load(f))
+        return manifest
+        
+    def save_manifest(self, stage, manifest):
+        with open(self.manifest_path(stage), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+            
+    def reusable_manifest(self, stage, input_fingerprint):
+        if not os.path.exists(self.manifest_path(stage)):
+            return None
+            
+        manifest = self.load_manifest(stage)
+        # Round-trip the config through JSON so tuples and lists compare the way they were saved
+        config = json.loads(json.dumps(self.stage_config(stage)))
+        same_input = manifest.get('input_fingerprint') == input_fingerprint and manifest['n_shards'] == self.n_shards
+        if not same_input or manifest['config'] != config:
+            return None
+        if not all(os.path.exists(entry['input']) for entry in manifest['shards']):
+            return None
+        return manifest
+        
+    def partition(self, stage, df):
+        # The same input under the same config keeps its shards, so finished ones are not redone
+        input_fingerprint = fingerprint_frame(df)
+        manifest = self.reusable_manifest(stage, input_fingerprint)
+        if manifest is not None:
+            done = sum(entry['status'] == 'done' for entry in manifest['shards'])
+            print(f"Reusing {stage} shards from {self.manifest_path(stage)}: {done}/{self.n_shards} already done")
+            return manifest
+            
+        os.makedirs(self.shard_dir, exist_ok=True)
+        for stale in glob.glob(os.path.join(self.shard_dir, f"{stage}-*")):
+            os.remove(stale)
+            
+        cleaner = RecruitmentDataCleaner(input_file=None, **self.cleaner_config)
+        if stage == 'clean':
+            # Company IDs are assigned in first-seen order, so they have to be resolved corpus-wide
+            cleaner.df = df.copy()
+            cleaner.resolve_companies()
+            df = cleaner.df
+        else:
+            # Positional labels let the merge rebuild the single-node summary chunks from the shard outputs
+            df = df.reset_index(drop=True)
+            
+        groups, keys = partition_keys(df, cleaner)
+        shard_ids = assign_shards(keys, self.n_shards)
+        
+        if stage == 'clean':
+            # remove_duplicates emits manual rows, then jobs, then others, each in input order;
+            # the order key lets the merge restore that layout across shards
+            df[ORDER_COLUMN] = groups * len(df) + np.arange(len(df), dtype=np.int64)
+            
+        shards = []
+        for shard in range(self.n_shards):
+            prefix = os.path.join(self.shard_dir, f"{stage}-{shard:04d}")
+            entry = {
+                'shard': shard,
+                'input': f"{prefix}.input.pkl",
+                'output': f"{prefix}.output.pkl",
+                'status_file': f"{prefix}.status.json",
+                'rows_in': int((shard_ids == shard).sum()),
+                'status': 'pending'
+            }
+            df[shard_ids == shard].to_pickle(entry['input'])
+            shards.append(entry)
+            
+        manifest = {
+            'stage': stage,
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'n_shards': self.n_shards,
+            'rows_in': len(df),
+            'input_fingerprint': input_fingerprint,
+            'config': self.stage_config(stage),
+            'shards': shards
+        }
+        self.save_manifest(stage, manifest)
+        print(f"Partitioned {len(df)} records into {self.n_shards} {stage} shards: {[s['rows_in'] for s in shards]}")
+        return manifest
+        
+    def process(self, stage, shard):
+        # Runs one shard in this process, e.g. on a node that shares the shard directory
+        manifest = self.load_manifest(stage)
+        entry = manifest['shards'][shard]
+        entry.update(process_shard(stage, entry, manifest['config']))
+        return entry
+        
+    def run_shards(self, stage):
+        manifest = self.load_manifest(stage)
+        pending = [entry for entry in manifest['shards'] if entry['status'] != 'done']
+        
+        print(f"Processing {len(pending)} {stage} shards with {self.n_workers} worker processes...")
+        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+            futures = [
+                (entry, executor.submit(process_shard, stage, entry, manifest['config']))
+                for entry in pending
+            ]
+            for entry, future in futures:
+                try:
+                    entry.update(future.result())
+                except Exception as e:
+                    entry['status'] = 'failed'
+                    print(f"Error processing {stage} shard {entry['shard']}: {e}")
+                    
+        self.save_manifest(stage, manifest)
+        self.check_finished(manifest)
+        return manifest
+        
+    def check_finished(self, manifest):
+        failed = [entry['shard'] for entry in manifest['shards'] if entry['status'] != 'done']
+        if failed:
+            raise RuntimeError(f"{manifest['stage']} shards {failed} did not finish; resume the stage to retry them")
+            
+    def merge_cleaned(self):
+        manifest = self.load_manifest('clean')
+        self.check_finished(manifest)
+        frames = [pd.read_pickle(entry['output']) for entry in manifest['shards']]
+        
+        merged = pd.concat(frames, ignore_index=True).sort_values(ORDER_COLUMN, kind='stable')
+        merged = merged.drop(columns=ORDER_COLUMN).reset_index(drop=True)
+        
+        # Shards build their own category sets, which concat widens to object
+        for column, dtype in frames[0].dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype):
+                merged[column] = merged[column].astype('category')
+                
+        print(f"Merged {len(frames)} clean shards. Records: {len(merged)}")
+        return merged
+        
+    def merge_annotated(self, n_samples=25):
+        manifest = self.load_manifest('annotate')
+        self.check_finished(manifest)
+        shard_passes = [pd.read_pickle(entry['output']) for entry in manifest['shards']]
+        
+        # Shards keep the global index of the cleaned frame, so sorting restores the single-node order
+        passes = []
+        for i in range(len(ANNOTATION_PASSES)):
+            frames = [annotated[i] for annotated in shard_passes]
+            non_empty = [frame for frame in frames if len(frame) > 0]
+            passes.append(pd.concat(non_empty).sort_index() if non_empty else frames[0])
+            
+        # Merging per-shard sketches only matches a single node while no sketch has reduced, so the summary is
+        # rebuilt from the merged passes in the same chunks a single node uses
+        annotator = RecruitmentDataAnnotator(input_file=None, **manifest['config'])
+        self.corpus_summary = annotator.summarize_chunks(passes, pd.RangeIndex(manifest['rows_in']))
+        
+        annotated_df = annotator.sample_annotations(tuple(passes), n_samples)
+        print(f"Merged {len(shard_passes)} annotate shards. Annotated samples: {len(annotated_df)}")
+        return annotated_df
+        
+    def resume(self, stage, n_samples=25):
+        # Retries the shards the existing manifest doesn't have as done, then merges all of them
+        self.run_shards(stage)
+        return self.merge_cleaned() if stage == 'clean' else self.merge_annotated(n_samples)
+        
+    def clean(self, df):
+        self.partition('clean', df)
+        self.run_shards('clean')
+        return self.merge_cleaned()
+        
+    def annotate(self, cleaned_df, n_samples=25):
+        self.partition('annotate', cleaned_df)
+        self.run_shards('annotate')
+        return self.merge_annotated(n_samples)
+        
+    def run(self, input_file='raw_recruitment_data.csv', cleaned_file='cleaned_recruitment_data.csv',
+            annotated_file='annotated_recruitment_data.csv', summary_file='annotation_summary.json'):
+        print(f"Starting sharded run with {self.n_shards} shards...")
+        
+        cleaned_df = self.clean(pd.read_csv(input_file))
+        cleaned_df.to_csv(cleaned_file, index=False)
+        print(f"Cleaned data saved to {cleaned_file}. Final record count: {len(cleaned_df)}")
+        
+        annotated_df = self.annotate(cleaned_df)
+        annotator = RecruitmentDataAnnotator(input_file=None, **self.annotator_config)
+        annotator.corpus_summary = self.corpus_summary
+        annotator.save_annotated_data(annotated_df, annotated_file)
+        annotator.save_corpus_summary(summary_file)
+        
+        print("Sharded run completed!")
+        return annotated_df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Clean and annotate in hash-partitioned shards, then merge")
+    parser.add_argument('command', choices=['run', 'partition', 'process', 'resume', 'merge'], nargs='?', default='run')
+    parser.add_argument('--stage', choices=SHARD_STAGES, default='clean')
+    parser.add_argument('--shard', type=int, help="shard to process with the 'process' command")
+    parser.add_argument('--shards', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=None, help="local worker processes standing in for nodes")
+    parser.add_argument('--shard-dir', default='shards')
+    parser.add_argument('--input', default=None, help="raw CSV for the clean stage, cleaned CSV for annotate")
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--compact-dtypes', action='store_true')
+    args = parser.parse_args()
+    
+    runner = ShardedRunner(
+        n_shards=args.shards,
+        n_workers=args.workers,
+        shard_dir=args.shard_dir,
+        cleaner_config={'compact_dtypes': args.compact_dtypes},
+        annotator_config={'compact_dtypes': args.compact_dtypes}
+    )
+    
+    if args.command == 'run':
+        runner.run(input_file=args.input or 'raw_recruitment_data.csv')
+    elif args.command == 'partition':
+        default_input = 'raw_recruitment_data.csv' if args.stage == 'clean' else 'cleaned_recruitment_data.csv'
+        runner.partition(args.stage, pd.read_csv(args.input or default_input))
+    elif args.command == 'process':
+        if args.shard is None:
+            parser.error("'process' needs --shard")
+        print(f"Processed {args.stage} shard {args.shard}: {runner.process(args.stage, args.shard)}")
+    elif args.stage == 'clean':
+        output_file = args.output or 'cleaned_recruitment_data.csv'
+        cleaned_df = runner.resume('clean') if args.command == 'resume' else runner.merge_cleaned()
+        cleaned_df.to_csv(output_file, index=False)
+        print(f"Cleaned data saved to {output_file}")
+    else:
+        output_file = args.output or 'annotated_recruitment_data.csv'
+        annotated_df = runner.resume('annotate') if args.command == 'resume' else runner.merge_annotated()
+        annotator = RecruitmentDataAnnotator(input_file=None, **runner.annotator_config)
+        annotator.corpus_summary = runner.corpus_summary
+        annotator.save_annotated_data(annotated_df, output_file)
+        annotator.save_corpus_summary()
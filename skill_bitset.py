@@ -0,0 +1,153 @@
+import json
+import numpy as np
+import pandas as pd
+
+WORD_BITS = 64
+
+
+class SkillVocabulary:
+    def __init__(self, skill_keywords):
+        self.skill_keywords = {category: list(skills) for category, skills in skill_keywords.items()}
+        self.skills = []
+        self.skill_categories = []
+        self.index = {}
+        
+        for category, skills in self.skill_keywords.items():
+            for skill in skills:
+                if skill in self.index:
+                    continue
+                self.index[skill] = len(self.skills)
+                self.skills.append(skill)
+                self.skill_categories.append(category)
+                
+        self.categories = list(self.skill_keywords.keys())
+        self.n_words = max(1, -(-len(self.skills) // WORD_BITS))
+        
+        # One row per category, one column per skill
+        self.category_matrix = np.zeros((len(self.categories), len(self.skills)), dtype=bool)
+        for i, category in enumerate(self.skill_categories):
+            self.category_matrix[self.categories.index(category), i] = True
+        self.category_masks = self.pack(self.category_matrix)
+        
+    def __len__(self):
+        return len(self.skills)
+        
+    def __eq__(self, other):
+        return isinstance(other, SkillVocabulary) and self.skill_keywords == other.skill_keywords
+        
+    def empty_masks(self, n_rows):
+        return np.zeros((n_rows, self.n_words), dtype=np.uint64)
+        
+    def pack(self, bool_matrix):
+        bool_matrix = np.asarray(bool_matrix, dtype=bool).reshape(-1, len(self.skills))
+        padded = np.zeros((bool_matrix.shape[0], self.n_words * WORD_BITS), dtype=bool)
+        padded[:, :len(self.skills)] = bool_matrix
+        packed = np.packbits(padded, axis=1, bitorder='little')
+        return np.ascontiguousarray(packed).view('<u8').astype(np.uint64)
+        
+    def unpack(self, masks):
+        masks = np.asarray(masks, dtype=np.uint64).reshape(-1, self.n_words)
+        as_bytes = np.ascontiguousarray(masks.astype('<u8')).view(np.uint8)
+        bits = np.unpackbits(as_bytes, axis=1, bitorder='little')
+        return bits[:, :len(self.skills)].astype(bool)
+        
+    def encode(self, skills):
+        return self.encode_many([skills])[0]
+        
+    def encode_many(self, skill_lists):
+        bool_matrix = np.zeros((len(skill_lists), len(self.skills)), dtype=bool)
+        for row, skills in enumerate(skill_lists):
+            for skill in skills:
+                if skill in self.index:
+                    bool_matrix[row, self.index[skill]] = True
+        return self.pack(bool_matrix)
+        
+    def decode(self, mask):
+        return self.decode_many(np.asarray(mask).reshape(1, -1))[0]
+        
+    def decode_many(self, masks):
+        bits = self.unpack(masks)
+        return [[self.skills[i] for i in np.flatnonzero(row)] for row in bits]
+        
+    def popcount(self, masks):
+        return self.unpack(masks).sum(axis=1)
+        
+    def skill_counts(self, masks):
+        totals = self.unpack(masks).sum(axis=0)
+        return {skill: int(totals[i]) for i, skill in enumerate(self.skills) if totals[i] > 0}
+        
+    def top_skills(self, masks, n=10):
+        totals = self.unpack(masks).sum(axis=0)
+        # Stable sort keeps vocabulary order among ties
+        order = np.argsort(-totals, kind='stable')
+        return {self.skills[i]: int(totals[i]) for i in order[:n] if totals[i] > 0}
+        
+    def cooccurrence(self, masks):
+        bits = self.unpack(masks).astype(np.int64)
+        return pd.DataFrame(bits.T @ bits, index=self.skills, columns=self.skills)
+        
+    def category_hits(self, masks):
+        masks = np.asarray(masks, dtype=np.uint64).reshape(-1, self.n_words)
+        hits = masks[:, None, :] & self.category_masks[None, :, :]
+        return (hits != 0).any(axis=2)
+        
+    def category_diversity(self, masks):
+        return self.category_hits(masks).sum(axis=1)
+        
+    def to_hex(self, masks):
+        masks = np.asarray(masks, dtype=np.uint64).reshape(-1, self.n_words)
+        width = self.n_words * 16
+        encoded = masks.astype('>u8').tobytes().hex()
+        return [encoded[i:i + width] for i in range(0, len(encoded), width)]
+        
+    def from_hex(self, hex_values):
+        hex_values = list(hex_values)
+        width = self.n_words * 16
+        for value in hex_values:
+            if len(value) != width:
+                raise ValueError(f"Skill mask '{value}' does not match vocabulary width of {width} hex digits")
+        buffer = bytes.fromhex(''.join(hex_values))
+        masks = np.frombuffer(buffer, dtype='>u8').astype(np.uint64)
+        return masks.reshape(len(hex_values), self.n_words)
+        
+    def to_dict(self):
+        return {'skill_keywords': self.skill_keywords, 'n_words': self.n_words}
+        
+    @classmethod
+    def from_dict(cls, data):
+        vocabulary = cls(data['skill_keywords'])
+        if vocabulary.n_words != data.get('n_words', vocabulary.n_words):
+            raise ValueError("Skill vocabulary width does not match the stored masks")
+        return vocabulary
+        
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+            
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def vocabulary_path(data_file):
+    base = data_file[:-4] if data_file.endswith('.csv') else data_file
+    return f"{base}.skills.json"
+
+
+def serialize_skill_list(skills):
+    if not isinstance(skills, list):
+        return skills
+    return json.dumps(skills)
+
+
+def parse_skill_list(value):
+    if isinstance(value, list):
+        return value
+    if pd.isna(value) or value == '':
+        return []
+    value = str(value)
+    if not value.startswith('['):
+        return [value]
+    # Older exports used Python list reprs with single quotes
+    return json.loads(value) if value.startswith('["') or value == '[]' else json.loads(value.replace("'", '"'))
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import queue
+import threading
+import time
+import pandas as pd
+from data_scraper import JobDataScraper
+from data_cleaner import RecruitmentDataCleaner
+from data_annotator import RecruitmentDataAnnotator
+
+STOP = object()
+
+
+def fingerprint_key(key):
+    return hashlib.blake2b(json.dumps(key, default=str).encode('utf-8'), digest_size=16).digest()
+
+
+def to_json_value(value):
+    if isinstance(value, list):
+        return value
+    if hasattr(value, 'item'):
+        value = value.item()
+    return None if pd.isna(value) else value
+
+
+class StreamingPipeline:
+    def __init__(self, scraper=None, cleaner=None, annotator=None, queue_size=100, n_cleaners=2, n_annotators=2):
+        self.scraper = scraper or JobDataScraper()
+        self.cleaner = cleaner or RecruitmentDataCleaner()
+        self.annotator = annotator or RecruitmentDataAnnotator()
+        self.queue_size = queue_size
+        self.n_cleaners = n_cleaners
+        self.n_annotators = n_annotators
+        
+        self.seen_fingerprints = set()
+        self.seen_lock = threading.Lock()
+        self.stats = {'scraped': 0, 'duplicates': 0, 'filtered': 0, 'annotated': 0}
+        self.stats_lock = threading.Lock()
+        
+    def count(self, stat):
+        with self.stats_lock:
+            self.stats[stat] += 1
+            
+    def is_duplicate(self, record):
+        fingerprint = fingerprint_key(self.cleaner.dedup_key(record))
+        with self.seen_lock:
+            if fingerprint in self.seen_fingerprints:
+                return True
+            self.seen_fingerprints.add(fingerprint)
+            return False
+            
+    def site_worker(self, label, scrape):
+        print(f"Scraping {label}...")
+        try:
+            scrape()
+        except Exception as e:
+            print(f"Error scraping {label}: {e}")
+            
+    def clean_worker(self, raw_queue, clean_queue):
+        while True:
+            record = raw_queue.get()
+            if record is STOP:
+                return
+                
+            try:
+                if self.is_duplicate(record):
+                    self.count('duplicates')
+                    continue
+                    
+                cleaned = self.cleaner.clean_record(record)
+                if cleaned is None:
+                    self.count('filtered')
+                    continue
+                    
+                clean_queue.put(cleaned)
+            except Exception as e:
+                print(f"Error cleaning record: {e}")
+                
+    def annotate_worker(self, clean_queue, output_queue):
+        while True:
+            record = clean_queue.get()
+            if record is STOP:
+                return
+                
+            try:
+                output_queue.put(self.annotator.annotate_record(record))
+                self.count('annotated')
+            except Exception as e:
+                print(f"Error annotating record: {e}")
+                
+    def start_stage(self, target, args, count):
+        threads = [threading.Thread(target=target, args=args, daemon=True) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads
+        
+    def finish_stage(self, threads, downstream, n_consumers):
+        # Once every thread of a stage is done, release each consumer of the next stage
+        for thread in threads:
+            thread.join()
+        for _ in range(n_consumers):
+            downstream.put(STOP)
+            
+    def stream(self):
+        raw_queue = queue.Queue(maxsize=self.queue_size)
+        clean_queue = queue.Queue(maxsize=self.queue_size)
+        output_queue = queue.Queue(maxsize=self.queue_size)
+        
+        def sink(record):
+            self.count('scraped')
+            raw_queue.put(self.scraper.normalize_record(record))
+            
+        self.scraper.record_sink = sink
+        
+        site_threads = [
+            threading.Thread(target=self.site_worker, args=(label, scrape), daemon=True)
+            for label, scrape in self.scraper.site_scrapers()
+        ]
+        for thread in site_threads:
+            thread.start()
+            
+        clean_threads = self.start_stage(self.clean_worker, (raw_queue, clean_queue), self.n_cleaners)
+        annotate_threads = self.start_stage(self.annotate_worker, (clean_queue, output_queue), self.n_annotators)
+        
+        for threads, downstream, n_consumers in [
+            (site_threads, raw_queue, self.n_cleaners),
+            (clean_threads, clean_queue, self.n_annotators),
+            (annotate_threads, output_queue, 1)
+        ]:
+            threading.Thread(target=self.finish_stage, args=(threads, downstream, n_consumers), daemon=True).start()
+            
+        while True:
+            record = output_queue.get()
+            if record is STOP:
+                break
+            yield record
+            
+        self.scraper.record_sink = None
+        
+    def run(self, output_file='streamed_recruitment_data.jsonl'):
+        print("Starting streaming pipeline...")
+        start = time.perf_counter()
+        first_record_at = None
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            for record in self.stream():
+                if first_record_at is None:
+                    first_record_at = time.perf_counter() - start
+                    print(f"First annotated record after {first_record_at:.2f}s")
+                    
+                f.write(json.dumps({key: to_json_value(value) for key, value in record.items()}) + '\n')
+                f.flush()
+                
+        elapsed = time.perf_counter() - start
+        print(f"Streamed records saved to {output_file}. Stats: {self.stats}")
+        print(f"Streaming pipeline completed in {elapsed:.2f}s")
+        return self.stats
+
+
+if __name__ == "__main__":
+    pipeline = StreamingPipeline()
+    pipeline.run()
@@ -0,0 +1,224 @@
+import argparse
+import numpy as np
+import pandas as pd
+from data_scraper import RAW_FIELDNAMES
+
+SKILL_POOL = [
+    'python', 'java', 'javascript', 'c++', 'c#', 'php', 'go', 'kotlin', 'typescript', 'scala',
+    'html', 'css', 'react', 'angular', 'node.js', 'django', 'flask', 'spring boot', 'jquery',
+    'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sql server', 'elasticsearch',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'terraform',
+    'android', 'ios', 'flutter', 'machine learning', 'deep learning', 'tensorflow', 'pandas',
+    'git', 'jira', 'selenium', 'maven', 'embedded c', 'linux', 'shell scripting', 'rest', 'microservices',
+    'problem solving', 'data structures', 'algorithms', 'agile methodologies', 'version control'
+]
+
+COMPANY_STEMS = [
+    'BHTC', 'Blueberry Labs', 'Votary Softech', 'Tekshapers Software', 'Dquip', 'Indodana', 'IQVIA',
+    'Silverlink Technologies', 'Suretek Infosoft', 'Vision Educare', 'Cargill', 'Autodesk', 'Mastercard',
+    'Microchip Technology', 'Infosys', 'Wipro', 'Zoho', 'Freshworks', 'Razorpay', 'Swiggy', 'Flipkart',
+    'Mindtree', 'Persistent Systems', 'Tata Elxsi', 'Hexaware', 'Cognizant', 'Accenture', 'Capgemini'
+]
+
+COMPANY_SUFFIXES = ['', ' India Pvt Ltd', ' Pvt. Ltd.', ' PRIVATE LIMITED', ' Private Limited', ' Ltd', ' Technologies', ' ( P )  Limited']
+
+LOCATIONS = [
+    'Bangalore', 'Bengaluru', 'Bangalore/Bengaluru, Karnataka', 'Hyderabad', 'Pune', 'Hybrid - Pune', 'Chennai',
+    'Mumbai', 'Noida', 'Gurgaon', 'Gurugram', 'Delhi NCR', 'Kolkata', 'Ahmedabad', 'Remote', 'Work From Home',
+    'Bangalore 5 km from centre', 'Hyderabad/Secunderabad, Telangana'
+]
+
+EXPERIENCE_RANGES = ['0-1 Yrs', '0-2 Yrs', '1-3 Yrs', '2-5 Yrs', '3-6 Yrs', '4-8 Yrs', '5-10 Yrs', '8-12 Yrs', 'Fresher', '5+ years']
+
+SALARIES = ['3-6 Lacs PA', '6-10 Lacs P.A.', '10-15 Lacs PA', '15-25 Lacs PA', 'Not disclosed', 'INR 4,00,000 - 7,00,000', '']
+
+TITLE_LEVELS = ['', 'Senior ', 'Lead ', 'Trainee ', 'Intern ', 'Principal ', 'Junior ', 'Associate ']
+
+TITLE_ROLES = ['Software Engineer', 'Software Developer', 'Backend Developer', 'Frontend Developer', 'Full Stack Developer',
+               'Data Scientist', 'DevOps Engineer', 'QA Engineer', 'Mobile App Developer', 'Embedded Software Engineer']
+
+DESCRIPTION_SENTENCES = [
+    'Software Developer will be responsible for analysis of requirements, implementation, testing and documentation.',
+    'Work side-by-side with a mentor to help you accomplish team goals and grow together.',
+    'Are you looking for a unique opportunity to be a part of something great?',
+    'We are a leading young and dynamic integrated digital technology company.',
+    'You will design, build and maintain efficient, reusable and reliable code.',
+    'Collaborate with cross-functional teams to define, design and ship new features.',
+    'Experience with distributed systems and cloud infrastructure is a plus.',
+    'Position Overview: join a global leader in design, engineering and entertainment software.'
+]
+
+QUESTION_TEMPLATES = [
+    'What is the difference between {a} and {b}?',
+    'Explain the concept of {a} in {b}',
+    'How do you handle {a} in {b}?',
+    'Describe a time you used {a} to solve a problem',
+    'What is the time complexity of {a}?',
+    'How does {a} work internally?',
+    'Tell me about a project where you used {a} and {b}',
+    'Write code to implement {a} using {b}'
+]
+
+QUESTION_TOPICS = ['abstract classes', 'interfaces', 'polymorphism', 'exceptions', 'garbage collection', 'quicksort',
+                   'dependency injection', 'REST APIs', 'SQL joins', 'indexing', 'caching', 'microservices',
+                   'unit testing', 'threads', 'closures', 'hash maps', 'binary search', 'load balancing']
+
+RESUME_TEMPLATES = [
+    '{role} with {years}+ years experience in {s1}, {s2} and {s3}. Built scalable applications serving {users}K+ users.',
+    '{role} proficient in {s1}, {s2}, and {s3}. Delivered responsive applications with modern design principles.',
+    '{role} skilled in {s1}, {s2} and {s3}. Automated deployment processes reducing release time by {pct}%.',
+    '{role} with {years} years in {s1} and {s2}. Published {apps}+ apps with {users}K+ downloads.',
+    'Experienced {role} specialized in {s1} and {s3}. Optimized performance improving speed by {pct}%.'
+]
+
+HTML_NOISE = ['<br>', '<p>', '</p>', '&amp;', '&nbsp;', '<li>', '</li>', '<b>', '</b>', '\n\t\t', '   ', '&#39;']
+
+DEFAULT_PROPORTIONS = {'interview_question': 20 / 51, 'job_description': 16 / 51, 'resume_summary': 15 / 51}
+
+
+def profile_from_csv(path='raw_recruitment_data.csv'):
+    try:
+        df = pd.read_csv(path)
+    except FileNotFoundError:
+        return {'content_types': DEFAULT_PROPORTIONS}
+
+    proportions = df['content_type'].value_counts(normalize=True).to_dict()
+    return {
+        'content_types': proportions,
+        'difficulties': df['difficulty'].dropna().value_counts(normalize=True).to_dict(),
+        'experience_levels': df['experience_level'].dropna().value_counts(normalize=True).to_dict(),
+        'job_sources': df.loc[df['content_type'] == 'job_description', 'source'].value_counts(normalize=True).to_dict()
+    }
+
+
+class SyntheticCorpusGenerator:
+    def __init__(self, seed=42, duplicate_rate=0.05, html_noise_rate=0.6, profile=None):
+        self.seed = seed
+        self.duplicate_rate = duplicate_rate
+        self.html_noise_rate = html_noise_rate
+        self.profile = profile or profile_from_csv()
+
+        self.content_types = list(self.profile['content_types'].keys())
+        self.content_type_weights = np.array(list(self.profile['content_types'].values()), dtype=float)
+        self.content_type_weights /= self.content_type_weights.sum()
+
+        self.difficulties, self.difficulty_weights = self.distribution('difficulties', ['beginner', 'intermediate', 'advanced'])
+        self.levels, self.level_weights = self.distribution('experience_levels', ['junior', 'mid', 'senior'])
+        self.job_sources, self.job_source_weights = self.distribution(
+            'job_sources', ['timesjobs', 'naukri', 'indeed', 'monster', 'shine', 'foundit', 'instahyre']
+        )
+
+    def distribution(self, key, default):
+        values = self.profile.get(key) or {value: 1.0 for value in default}
+        weights = np.array(list(values.values()), dtype=float)
+        return list(values.keys()), weights / weights.sum()
+
+    def noisy(self, rng, text):
+        if rng.random() >= self.html_noise_rate:
+            return text
+        words = text.split(' ')
+        for _ in range(rng.integers(1, 5)):
+            position = rng.integers(0, len(words) + 1)
+            words.insert(position, HTML_NOISE[rng.integers(len(HTML_NOISE))])
+        return ' '.join(words)
+
+    def job_posting(self, rng, source):
+        skills = rng.choice(SKILL_POOL, size=rng.integers(2, 14), replace=False)
+        sentences = rng.choice(DESCRIPTION_SENTENCES, size=rng.integers(1, 4), replace=False)
+        # Scraped skill chips come with the site's layout whitespace around them
+        skill_block = '\n   \t\t'.join(skills)
+        description = self.noisy(rng, ' '.join(sentences) + ' ... \n     \t ' + skill_block)
+        role = TITLE_ROLES[rng.integers(len(TITLE_ROLES))]
+        title = TITLE_LEVELS[rng.integers(len(TITLE_LEVELS))] + role
+        if rng.random() < 0.2:
+            title += f"  /  {role}"
+
+        return {
+            'source': source,
+            'job_title': title,
+            'company': COMPANY_STEMS[rng.integers(len(COMPANY_STEMS))] + COMPANY_SUFFIXES[rng.integers(len(COMPANY_SUFFIXES))],
+            'location': LOCATIONS[rng.integers(len(LOCATIONS))] if rng.random() < 0.7 else '',
+            'description': description,
+            'salary': SALARIES[rng.integers(len(SALARIES))],
+            'experience': EXPERIENCE_RANGES[rng.integers(len(EXPERIENCE_RANGES))] if rng.random() < 0.5 else '',
+            'content_type': 'job_description'
+        }
+
+    def interview_question(self, rng, difficulty, row_id):
+        template = QUESTION_TEMPLATES[rng.integers(len(QUESTION_TEMPLATES))]
+        a, b = rng.choice(QUESTION_TOPICS + SKILL_POOL[:10], size=2, replace=False)
+        return {
+            'source': 'manual_collection',
+            # The templates only span a few thousand questions; numbering keeps every generated row distinct
+            'content': f"Q{row_id}. " + template.format(a=a, b=b),
+            'content_type': 'interview_question',
+            'difficulty': difficulty,
+            'category': 'technical'
+        }
+
+    def resume(self, rng, level, row_id):
+        s1, s2, s3 = rng.choice(SKILL_POOL, size=3, replace=False)
+        template = RESUME_TEMPLATES[rng.integers(len(RESUME_TEMPLATES))]
+        content = template.format(
+            role=TITLE_ROLES[rng.integers(len(TITLE_ROLES))], years=int(rng.integers(1, 12)),
+            s1=s1, s2=s2, s3=s3, users=int(rng.integers(10, 900)), pct=int(rng.integers(10, 80)),
+            apps=int(rng.integers(2, 20))
+        ) + f" Candidate ref {row_id}."
+        return {
+            'source': 'manual_collection',
+            'content': content,
+            'content_type': 'resume_summary',
+            'experience_level': level,
+            'domain': 'software_engineering'
+        }
+
+    def generate_chunk(self, n_rows, chunk_index=0, first_row=0):
+        # Each chunk has its own seeded stream, so any chunk can be regenerated on its own
+        rng = np.random.default_rng([self.seed, chunk_index])
+
+        types = rng.choice(self.content_types, size=n_rows, p=self.content_type_weights)
+        difficulties = rng.choice(self.difficulties, size=n_rows, p=self.difficulty_weights)
+        levels = rng.choice(self.levels, size=n_rows, p=self.level_weights)
+        sources = rng.choice(self.job_sources, size=n_rows, p=self.job_source_weights)
+        duplicates = rng.random(n_rows) < self.duplicate_rate
+
+        # Only the duplicate mask repeats a record; everything else is unique across the corpus
+        records = []
+        for i in range(n_rows):
+            if duplicates[i] and records:
+                records.append(records[rng.integers(len(records))])
+            elif types[i] == 'job_description':
+                records.append(self.job_posting(rng, sources[i]))
+            elif types[i] == 'interview_question':
+                records.append(self.interview_question(rng, difficulties[i], first_row + i))
+            else:
+                records.append(self.resume(rng, levels[i], first_row + i))
+
+        df = pd.DataFrame(records, columns=RAW_FIELDNAMES)
+        return df.replace('', np.nan)
+
+    def iter_chunks(self, n_rows, chunk_size=100000):
+        for chunk_index, start in enumerate(range(0, n_rows, chunk_size)):
+            yield self.generate_chunk(min(chunk_size, n_rows - start), chunk_index, start)
+
+    def generate(self, n_rows, chunk_size=100000):
+        return pd.concat(self.iter_chunks(n_rows, chunk_size), ignore_index=True)
+
+    def write_csv(self, path, n_rows, chunk_size=100000):
+        for chunk_index, chunk in enumerate(self.iter_chunks(n_rows, chunk_size)):
+            chunk.to_csv(path, mode='w' if chunk_index == 0 else 'a', header=chunk_index == 0, index=False)
+
+        print(f"Synthetic corpus saved to {path}. Total records: {n_rows}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic recruitment corpus")
+    parser.add_argument('rows', type=int)
+    parser.add_argument('--output', default='synthetic_recruitment_data.csv')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--duplicate-rate', type=float, default=0.05)
+    parser.add_argument('--chunk-size', type=int, default=100000)
+    args = parser.parse_args()
+
+    generator = SyntheticCorpusGenerator(seed=args.seed, duplicate_rate=args.duplicate_rate)
+    generator.write_csv(args.output, args.rows, args.chunk_size)
@@ -0,0 +1,43 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from data_annotator import RecruitmentDataAnnotator
+
+
+@pytest.fixture(scope='session')
+def raw_df():
+    return pd.read_csv(os.path.join(REPO_ROOT, 'raw_recruitment_data.csv'))
+
+
+@pytest.fixture(scope='session')
+def cleaned_df():
+    return pd.read_csv(os.path.join(REPO_ROOT, 'cleaned_recruitment_data.csv'))
+
+
+@pytest.fixture(scope='session')
+def vocabulary():
+    return RecruitmentDataAnnotator(input_file=None).skill_vocab
+
+
+@pytest.fixture(scope='session')
+def synthetic_raw_df():
+    from synthetic_data import SyntheticCorpusGenerator
+    return SyntheticCorpusGenerator(seed=7).generate(4000)
+
+
+@pytest.fixture(scope='session')
+def synthetic_cleaned_df(synthetic_raw_df):
+    from data_cleaner import RecruitmentDataCleaner
+    cleaned_df = RecruitmentDataCleaner(input_file=None).clean_frame(synthetic_raw_df)
+    
+    # Far more employers than a summary sketch holds, with a long tail, so the sketches have to reduce
+    rng = np.random.default_rng(0)
+    companies = np.array([f"Employer {i}" for i in range(3000)], dtype=object)[rng.zipf(1.2, len(cleaned_df)) % 3000]
+    cleaned_df['company_canonical'] = pd.Categorical(companies)
+    return cleaned_df
@@ -0,0 +1,98 @@
+from collections import Counter
+import numpy as np
+import pandas as pd
+from annotation_summary import HeavyHitterSketch, SummaryAccumulator
+
+
+def zipf_batches(n_values=20000, n_keys=500, seed=0):
+    values = np.random.default_rng(seed).zipf(1.3, n_values) % n_keys
+    return values, Counter(values.tolist())
+
+
+def sketch_of(values, capacity, batch_size):
+    sketch = HeavyHitterSketch(capacity)
+    for start in range(0, len(values), batch_size):
+        sketch.update(Counter(values[start:start + batch_size].tolist()))
+    return sketch
+
+
+def test_sketch_is_exact_below_capacity():
+    values, true_counts = zipf_batches(n_keys=50)
+    sketch = sketch_of(values, capacity=64, batch_size=1000)
+    
+    assert sketch.counts == true_counts
+    assert sketch.max_error() == 0
+
+
+def test_sketch_undercounts_within_error_bound():
+    values, true_counts = zipf_batches()
+    
+    for batch_size in (100, 1000, len(values)):
+        sketch = sketch_of(values, capacity=32, batch_size=batch_size)
+        assert len(sketch.counts) <= 32
+        for key, count in true_counts.items():
+            assert 0 <= count - sketch.counts.get(key, 0) <= sketch.max_error()
+
+
+def test_sketch_merge_order_does_not_change_the_bound():
+    values, true_counts = zipf_batches()
+    parts = [sketch_of(part, capacity=32, batch_size=500) for part in np.array_split(values, 4)]
+    
+    forward = parts[0].merge(parts[1]).merge(parts[2]).merge(parts[3])
+    backward = parts[3].merge(parts[2]).merge(parts[1].merge(parts[0]))
+    
+    for merged in (forward, backward):
+        assert merged.total == len(values)
+        for key, count in true_counts.items():
+            assert 0 <= count - merged.counts.get(key, 0) <= merged.max_error()
+
+
+def test_sketch_dict_round_trip():
+    values, _ = zipf_batches()
+    sketch = sketch_of(values, capacity=32, batch_size=1000)
+    restored = HeavyHitterSketch.from_dict(sketch.to_dict())
+    
+    assert restored.counts == sketch.counts
+    assert restored.max_error() == sketch.max_error()
+
+
+def annotated_batch(vocabulary, skills, companies):
+    return pd.DataFrame({
+        'content_type': ['job_description'] * len(skills),
+        'skill_mask': vocabulary.to_hex(vocabulary.encode_many(skills)),
+        'company_canonical': companies
+    })
+
+
+def test_accumulator_merge_matches_single_pass(vocabulary):
+    skills = [['python', 'docker'], ['java'], ['python'], ['aws', 'python', 'git']] * 5
+    companies = ['BHTC', 'Infosys', 'BHTC', 'Zoho'] * 5
+    df = annotated_batch(vocabulary, skills, companies)
+    
+    whole = SummaryAccumulator(vocabulary).update(df)
+    halves = SummaryAccumulator(vocabulary).update(df.iloc[:7]).merge(SummaryAccumulator(vocabulary).update(df.iloc[7:]))
+    
+    assert halves.to_summary() == whole.to_summary()
+    assert whole.to_summary()['top_companies'] == {'BHTC': 10, 'Infosys': 5, 'Zoho': 5}
+    assert whole.to_summary()['sketch_max_error'] == {'top_skills': 0, 'top_companies': 0}
+
+
+def test_accumulator_dict_round_trip(vocabulary):
+    df = annotated_batch(vocabulary, [['python'], ['r', 'numpy']], ['BHTC', 'Zoho'])
+    accumulator = SummaryAccumulator(vocabulary).update(df)
+    
+    assert SummaryAccumulator.from_dict(accumulator.to_dict()).to_summary() == accumulator.to_summary()
+
+
+def test_file_summary_streams_the_same_batches(synthetic_cleaned_df, tmp_path):
+    from data_annotator import RecruitmentDataAnnotator
+    annotator = RecruitmentDataAnnotator(input_file=None, summary_capacity=8)
+    annotator.df = synthetic_cleaned_df
+    path = str(tmp_path / 'annotated.csv')
+    annotator.save_annotated_data(pd.concat(annotator.run_annotation_passes()), path)
+    
+    loaded = annotator.generate_annotation_summary(annotator.load_annotated_data(path), batch_size=300)
+    streamed = annotator.generate_file_summary(path, batch_size=300)
+    
+    assert streamed['sketch_max_error']['top_companies'] > 0
+    assert streamed == loaded
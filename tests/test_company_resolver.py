@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+from company_resolver import CompanyResolver, company_key, display_name
+
+
+@pytest.mark.parametrize('name, key', [
+    ('BHTC India Pvt Ltd', 'bhtc'),
+    ('Tekshapers Software Solutions ( P ) Limited', 'tekshapers software solutions'),
+    ('L&amp;T Infotech', 'l and t infotech'),
+    ('Air India', 'air india'),
+    ('Coal India Limited', 'coal india'),
+    ('Bank of India', 'bank of india'),
+    ('India', 'india'),
+    ('Limited', 'limited'),
+    ('', None),
+    (None, None)
+])
+def test_company_key(name, key):
+    assert company_key(name) == key
+
+
+def test_display_name_drops_legal_form():
+    assert display_name('BHTC India Pvt Ltd') == 'BHTC'
+    assert display_name('  Coal   India Limited') == 'Coal India'
+
+
+def resolve_all(names):
+    resolver = CompanyResolver()
+    return resolver, [resolver.resolve(name) for name in names]
+
+
+def test_spelling_variants_merge():
+    resolver, ids = resolve_all([
+        'BHTC', 'BHTC India Pvt Ltd', 'bhtc pvt. ltd.',
+        'Infosys', 'Infosys Technologies', 'INFOSYS LIMITED'
+    ])
+    
+    assert ids[0] == ids[1] == ids[2]
+    assert ids[3] == ids[4] == ids[5]
+    assert resolver.canonical_name(ids[1]) == 'BHTC'
+
+
+@pytest.mark.parametrize('names', [
+    ['Tata Consultancy Services', 'Tata Technologies', 'Tata'],
+    ['L&T Infotech', 'L&T Technology Services'],
+    ['Air India', 'Coal India Limited', 'Bank of India', 'India', 'Limited'],
+    ['Tata Elxsi', 'Tata Consultancy Services']
+])
+def test_distinct_employers_stay_apart(names):
+    _, ids = resolve_all(names)
+    assert len(set(ids)) == len(names)
+
+
+def test_different_descriptor_sets_do_not_merge():
+    _, ids = resolve_all(['Votary Softech Solutions', 'Votary Softech Services', 'Votary Softech'])
+    # The bare name could be either company, so it becomes its own
+    assert len(set(ids)) == 3
+    
+    _, ids = resolve_all(['Votary Softech Solutions', 'Votary Softech'])
+    assert ids[0] == ids[1]
+
+
+def test_resolve_series_broadcasts_ids():
+    resolver = CompanyResolver()
+    resolved = resolver.resolve_series(pd.Series(['Zoho Corp', None, 'ZOHO', 'Wipro Ltd']))
+    
+    assert resolved['company_id'].tolist() == [0, pd.NA, 0, 1]
+    assert resolved['company_canonical'].tolist()[2:] == ['Zoho', 'Wipro']
+
+
+def test_save_load_round_trip(tmp_path):
+    path = str(tmp_path / 'aliases.json')
+    resolver, ids = resolve_all(['BHTC India Pvt Ltd', 'Zoho', 'Tata Technologies'])
+    resolver.save(path)
+    loaded = CompanyResolver.load(path)
+    
+    assert [loaded.resolve(name) for name in ['BHTC', 'Zoho Corp', 'Tata Technologies Ltd', 'Wipro']] == ids + [3]
@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+from data_cleaner import RecruitmentDataCleaner
+from data_scraper import JobDataScraper, RAW_FIELDNAMES
+
+
+@pytest.fixture
+def scraper(raw_df):
+    scraper = JobDataScraper()
+    for i, row in enumerate(raw_df.to_dict('records')):
+        # Scrapers write "N/A" for missing page elements and leave unused fields out or empty
+        record = {field: 'N/A' if i % 2 else '' for field, value in row.items() if pd.isna(value)}
+        record.update({field: value for field, value in row.items() if pd.notna(value)})
+        scraper.emit_record(record)
+        
+    scraper.emit_record({'source': 'indeed', 'job_title': 'Engineer', 'company': 'N/A', 'description': None,
+                         'location': 'n/a', 'content_type': 'job_description'})
+    return scraper
+
+
+def test_to_dataframe_matches_csv_round_trip(scraper, tmp_path):
+    path = str(tmp_path / 'raw.csv')
+    scraper.save_raw_data(path)
+    from_csv = pd.read_csv(path)
+    in_memory = scraper.to_dataframe()
+
+    assert list(in_memory.columns) == RAW_FIELDNAMES
+    pd.testing.assert_frame_equal(in_memory, from_csv, check_dtype=False)
+    assert in_memory['company'].iloc[-1] != in_memory['company'].iloc[-1]
+
+    cleaned_in_memory = RecruitmentDataCleaner(input_file=None).clean_frame(in_memory)
+    cleaned_from_csv = RecruitmentDataCleaner(input_file=None).clean_frame(from_csv)
+    pd.testing.assert_frame_equal(cleaned_in_memory, cleaned_from_csv, check_dtype=False)
+    assert 'N/A' not in set(cleaned_in_memory['company_canonical'].dropna())
+
+
+def test_normalize_record_matches_to_dataframe(scraper):
+    rows = pd.DataFrame([scraper.normalize_record(record) for record in scraper.scraped_data], columns=RAW_FIELDNAMES)
+    pd.testing.assert_frame_equal(rows, scraper.to_dataframe())
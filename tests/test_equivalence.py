@@ -0,0 +1,122 @@
+import os
+import pandas as pd
+import pytest
+from data_cleaner import RecruitmentDataCleaner
+from data_annotator import RecruitmentDataAnnotator
+from sharded_runner import ShardedRunner
+
+
+def normalized(df):
+    # Compact frames hold the same values in categorical and nullable dtypes
+    return df.astype(str).replace('<NA>', 'nan').reset_index(drop=True)
+
+
+def assert_same_frame(left, right):
+    assert list(left.columns) == list(right.columns)
+    pd.testing.assert_frame_equal(normalized(left), normalized(right))
+
+
+def clean(raw_df, compact=False):
+    return RecruitmentDataCleaner(input_file=None, compact_dtypes=compact).clean_frame(raw_df)
+
+
+def annotate(cleaned_df, **config):
+    annotator = RecruitmentDataAnnotator(input_file=None, **config)
+    samples = annotator.annotate_frame(cleaned_df.copy())
+    return samples, annotator.corpus_summary.to_summary()
+
+
+@pytest.fixture(scope='module')
+def single_cleaned(raw_df):
+    return clean(raw_df)
+
+
+@pytest.fixture(scope='module')
+def single_annotated(single_cleaned):
+    return annotate(single_cleaned)
+
+
+def test_compact_cleaning_matches_default(raw_df, single_cleaned):
+    assert_same_frame(single_cleaned, clean(raw_df, compact=True))
+
+
+def test_compact_annotation_matches_default(single_cleaned, single_annotated):
+    samples, summary = annotate(single_cleaned, compact_dtypes=True)
+    assert_same_frame(single_annotated[0], samples)
+    assert summary == single_annotated[1]
+
+
+def test_bundled_cleaned_csv_annotates_the_same_in_both_modes(cleaned_df):
+    default_samples, default_summary = annotate(cleaned_df)
+    compact_samples, compact_summary = annotate(cleaned_df, compact_dtypes=True)
+    
+    assert_same_frame(default_samples, compact_samples)
+    assert compact_summary == default_summary
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_parallel_annotation_matches_single_worker(single_cleaned, compact):
+    serial = annotate(single_cleaned, compact_dtypes=compact, chunk_size=10)
+    parallel = annotate(single_cleaned, compact_dtypes=compact, chunk_size=10, n_workers=3)
+    
+    assert_same_frame(serial[0], parallel[0])
+    assert parallel[1] == serial[1]
+
+
+@pytest.mark.parametrize('config', [{'chunk_size': 500, 'summary_capacity': 8}, {'chunk_size': 1000}])
+def test_parallel_summary_matches_single_worker_once_sketches_reduce(synthetic_cleaned_df, config):
+    serial = annotate(synthetic_cleaned_df, **config)
+    parallel = annotate(synthetic_cleaned_df, n_workers=3, **config)
+    
+    assert serial[1]['sketch_max_error']['top_companies'] > 0
+    assert parallel[1] == serial[1]
+    assert_same_frame(serial[0], parallel[0])
+
+
+def test_workers_use_the_parent_settings(synthetic_cleaned_df):
+    annotator = RecruitmentDataAnnotator(input_file=None, n_workers=2, chunk_size=500, summary_capacity=8)
+    annotator.annotate_frame(synthetic_cleaned_df.copy())
+    
+    assert annotator.corpus_summary.capacity == 8
+    assert all(len(sketch.counts) <= 8 for sketch in annotator.corpus_summary.sketches.values())
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_sharded_run_matches_single_node(raw_df, single_cleaned, single_annotated, tmp_path, compact):
+    config = {'compact_dtypes': compact}
+    runner = ShardedRunner(n_shards=3, n_workers=2, shard_dir=str(tmp_path),
+                           cleaner_config=config, annotator_config=config)
+    
+    sharded_cleaned = runner.clean(raw_df)
+    assert_same_frame(single_cleaned, sharded_cleaned)
+    
+    samples = runner.annotate(sharded_cleaned)
+    assert_same_frame(single_annotated[0], samples)
+    assert runner.corpus_summary.to_summary() == single_annotated[1]
+
+
+def test_sharded_resume_retries_only_missing_shards(raw_df, single_cleaned, tmp_path):
+    runner = ShardedRunner(n_shards=3, n_workers=2, shard_dir=str(tmp_path))
+    runner.clean(raw_df)
+    
+    lost = runner.load_manifest('clean')['shards'][1]
+    os.remove(lost['output'])
+    kept_mtime = os.path.getmtime(runner.load_manifest('clean')['shards'][0]['output'])
+    
+    manifest = runner.partition('clean', raw_df)
+    assert [entry['status'] for entry in manifest['shards']] == ['done', 'pending', 'done']
+    
+    assert_same_frame(single_cleaned, runner.resume('clean'))
+    assert os.path.getmtime(manifest['shards'][0]['output']) == kept_mtime
+
+
+def test_sharded_summary_matches_single_node_once_sketches_reduce(synthetic_cleaned_df, tmp_path):
+    config = {'chunk_size': 500, 'summary_capacity': 8}
+    single = annotate(synthetic_cleaned_df, **config)
+    
+    runner = ShardedRunner(n_shards=3, n_workers=2, shard_dir=str(tmp_path), annotator_config=config)
+    samples = runner.annotate(synthetic_cleaned_df)
+    
+    assert single[1]['sketch_max_error']['top_companies'] > 0
+    assert runner.corpus_summary.to_summary() == single[1]
+    assert_same_frame(single[0], samples)
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+from experience_years import filter_by_experience, level_from_years, parse_experience, parse_experience_text
+
+CASES = [
+    ('3-5 Yrs', (3.0, 5.0)),
+    ('8 to 12 years', (8.0, 12.0)),
+    ('5 - 2 years', (2.0, 5.0)),
+    ('1.5-3 yrs', (1.5, 3.0)),
+    ('5+ years', (5.0, np.nan)),
+    ('2 years of experience', (2.0, np.nan)),
+    ('Fresher', (0.0, 1.0)),
+    ('Entry-level role', (0.0, 1.0)),
+    ('Over 100 years of legacy', (np.nan, np.nan)),
+    ('Since 2015 years', (np.nan, np.nan)),
+    ('2-100 years', (np.nan, np.nan)),
+    ('Built 20+ apps', (np.nan, np.nan)),
+    ('', (np.nan, np.nan)),
+    (None, (np.nan, np.nan))
+]
+
+
+@pytest.mark.parametrize('text, expected', CASES)
+def test_parse_experience_text(text, expected):
+    np.testing.assert_array_equal(parse_experience_text(text), expected)
+
+
+def test_vectorized_parse_matches_scalar():
+    texts = pd.Series([text for text, _ in CASES], index=np.arange(len(CASES)) * 3)
+    parsed = parse_experience(texts)
+    
+    assert parsed.index.equals(texts.index)
+    expected = np.array([values for _, values in CASES], dtype='float32')
+    np.testing.assert_array_equal(parsed.to_numpy(), expected)
+
+
+def test_level_from_years():
+    levels = level_from_years([0.0, 1.5, 2.0, 4.0, 5.0, 12.0, np.nan])
+    assert levels[:6].tolist() == ['junior', 'junior', 'mid', 'mid', 'senior', 'senior']
+    assert pd.isna(levels[6])
+
+
+def test_filter_by_experience():
+    df = pd.DataFrame({'exp_min_years': [0.0, 2.0, 5.0, np.nan], 'exp_max_years': [1.0, 5.0, np.nan, np.nan]})
+    assert filter_by_experience(df, 3).index.tolist() == [1]
+    assert filter_by_experience(df, 7).index.tolist() == [2]
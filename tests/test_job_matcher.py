@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+from job_matcher import JobMatcher
+
+
+def random_frame(vocabulary, n_rows, seed):
+    rng = np.random.default_rng(seed)
+    # Few skills and small sets give many tied scores at the top-k boundary
+    skill_lists = [list(rng.choice(vocabulary.skills[:12], size=rng.integers(1, 4), replace=False)) for _ in range(n_rows)]
+    return pd.DataFrame({
+        'skill_mask': vocabulary.to_hex(vocabulary.encode_many(skill_lists)),
+        'experience_level_annotated': rng.choice(['junior', 'mid', 'senior', None], n_rows)
+    })
+
+
+@pytest.fixture(scope='module')
+def frames(vocabulary):
+    return random_frame(vocabulary, 60, seed=1), random_frame(vocabulary, 700, seed=2)
+
+
+@pytest.mark.parametrize('similarity', ['jaccard', 'cosine'])
+def test_top_k_matches_full_sort(vocabulary, frames, similarity):
+    matcher = JobMatcher(vocabulary, similarity=similarity)
+    queries, targets = matcher.prepare(frames[0]), matcher.prepare(frames[1])
+    
+    scores = matcher.score_block(queries, targets)
+    positions = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    expected = np.lexsort((positions, -scores), axis=1)[:, :10]
+    
+    for query_block_size, target_block_size in [(7, 5), (16, 64), (2048, 8192)]:
+        matcher.query_block_size = query_block_size
+        matcher.target_block_size = target_block_size
+        indices, top_scores = matcher.top_k(queries, targets, k=10)
+        
+        assert (indices == expected).all()
+        np.testing.assert_array_equal(top_scores, np.take_along_axis(scores, expected, axis=1))
+
+
+def test_k_larger_than_targets(vocabulary, frames):
+    matcher = JobMatcher(vocabulary, target_block_size=4)
+    matches = matcher.match(frames[0].iloc[:3], frames[1].iloc[:5], k=10)
+    
+    assert len(matches) == 15
+    assert matches.groupby('query_index')['rank'].max().tolist() == [5, 5, 5]
@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+from location_gazetteer import LocationGazetteer
+
+
+@pytest.fixture(scope='module')
+def gazetteer():
+    return LocationGazetteer()
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Bangalore/Bengaluru, Karnataka', ('Bengaluru', 'Karnataka', 'onsite')),
+    ('Navi Mumbai', ('Mumbai', 'Maharashtra', 'onsite')),
+    ('Hybrid - Pune', ('Pune', 'Maharashtra', 'hybrid')),
+    ('Work From Home', (None, None, 'remote')),
+    ('Gurgaon, Haryana (Remote)', ('Gurugram', 'Haryana', 'remote')),
+    ('Tamil Nadu', (None, 'Tamil Nadu', 'onsite')),
+    ('Bangalore 5 km from centre', ('Bengaluru', 'Karnataka', 'onsite')),
+    ('Atlantis', (None, None, None)),
+    ('', (None, None, None)),
+    (None, (None, None, None))
+])
+def test_resolve(gazetteer, text, expected):
+    assert gazetteer.resolve(text) == expected
+
+
+def test_longest_alias_wins(gazetteer):
+    assert gazetteer.match('greater noida') == [('city', 'Noida')]
+    assert gazetteer.match('new delhi and mumbai suburban') == [('city', 'New Delhi'), ('city', 'Mumbai')]
+
+
+def test_canonicalize_matches_resolve(gazetteer):
+    locations = pd.Series(['Bangalore', 'Remote', None, 'Bangalore', 'Hyderabad/Secunderabad, Telangana'])
+    canonical = gazetteer.canonicalize(locations)
+    
+    assert list(canonical.columns) == ['location_city', 'location_state', 'work_mode']
+    for i, text in locations.items():
+        row = tuple(None if pd.isna(value) else value for value in canonical.loc[i])
+        assert row == gazetteer.resolve(text)
+
+
+def test_save_load_round_trip(gazetteer, tmp_path):
+    path = tmp_path / 'gazetteer.json'
+    gazetteer.save(path)
+    loaded = LocationGazetteer.load(path)
+    
+    assert loaded.to_dict() == gazetteer.to_dict()
+    assert loaded.resolve('Cochin') == ('Kochi', 'Kerala', 'onsite')
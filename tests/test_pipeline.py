@@ -0,0 +1,30 @@
+import json
+import pandas as pd
+from location_gazetteer import LocationGazetteer
+from pipeline import RecruitmentPipeline, fingerprint_code
+
+
+def test_stage_key_follows_config_file_contents(tmp_path):
+    path = tmp_path / 'gazetteer.json'
+    LocationGazetteer().save(path)
+    pipeline = RecruitmentPipeline(cache_dir=str(tmp_path), stage_configs={'clean': {'gazetteer_file': str(path)}})
+    before = pipeline.stage_key('clean', 'input')
+    
+    data = json.loads(path.read_text())
+    data['cities']['Surat'] = ['Gujarat', ['surat']]
+    path.write_text(json.dumps(data))
+    
+    assert pipeline.stage_key('clean', 'input') != before
+
+
+def test_code_fingerprint_differs_per_stage():
+    assert len({fingerprint_code(stage) for stage in ('scrape', 'clean', 'annotate')}) == 3
+
+
+def test_scrape_is_not_read_from_cache_by_default(tmp_path):
+    pipeline = RecruitmentPipeline(cache_dir=str(tmp_path))
+    key = pipeline.stage_key('scrape', None)
+    pipeline.store_cached('scrape', key, pd.DataFrame({'a': [1]}))
+    
+    assert pipeline.load_cached('scrape', key) is None
+    assert RecruitmentPipeline(cache_dir=str(tmp_path), cached_stages=('scrape',)).load_cached('scrape', key) is not None
@@ -0,0 +1,82 @@
+import pandas as pd
+import pytest
+from posting_index import PostingIndex
+
+
+@pytest.fixture
+def index():
+    return PostingIndex.from_lists({
+        'skill:java': [0, 1, 2],
+        'skill:python': [1, 2, 3],
+        'level:senior': [2, 3],
+        'level:mid': [0],
+        'company:procter and gamble': [4],
+        'company:infosys': [1]
+    }, 5)
+
+
+@pytest.mark.parametrize('expression, expected', [
+    ('java AND python', [1, 2]),
+    ('java and python', [1, 2]),
+    ('java Or python', [0, 1, 2, 3]),
+    ('java AND (senior OR mid)', [0, 2]),
+    ('(java or python) and not_a_term', []),
+    ('level:senior', [2, 3]),
+    ('company:"Procter and Gamble"', [4]),
+    ('"procter and gamble" OR company:infosys', [1, 4]),
+    ('  Python  ', [1, 2, 3])
+])
+def test_query(index, expression, expected):
+    assert index.query(expression).tolist() == expected
+
+
+@pytest.mark.parametrize('expression', ['java AND', 'and java', '(java OR python', 'java )', '"java'])
+def test_malformed_query_raises(index, expression):
+    with pytest.raises(ValueError):
+        index.query(expression)
+
+
+def test_save_load_round_trip(index, tmp_path):
+    path = str(tmp_path / 'postings')
+    index.save(path)
+    loaded = PostingIndex.load(path)
+    
+    assert loaded.terms == index.terms
+    assert loaded.query('java and (senior or mid)').tolist() == [0, 2]
+
+
+def test_build_indexes_canonical_company(vocabulary):
+    df = pd.DataFrame({
+        'skill_mask': vocabulary.to_hex(vocabulary.encode_many([['python'], ['java'], ['python', 'java']])),
+        'company': ['BHTC India Pvt Ltd', 'BHTC', 'Zoho Corp'],
+        'company_canonical': ['BHTC', 'BHTC', 'Zoho'],
+        'experience_level_annotated': ['senior', 'Senior ', 'mid']
+    })
+    index = PostingIndex.build(df, vocabulary)
+    
+    assert index.query('company:bhtc').tolist() == [0, 1]
+    assert index.query('level:senior AND python').tolist() == [0]
+    assert index.query('zoho').tolist() == [2]
+
+
+def test_build_falls_back_to_raw_company(vocabulary):
+    df = pd.DataFrame({'company': ['BHTC India Pvt Ltd', 'Zoho']})
+    assert PostingIndex.build(df, vocabulary).query('company:"bhtc india pvt ltd"').tolist() == [0]
+
+
+def test_place_names_resolve_to_canonical_locations(vocabulary):
+    df = pd.DataFrame({
+        'skill_mask': vocabulary.to_hex(vocabulary.encode_many([['java'], ['java'], ['python'], ['java']])),
+        'location': ['Bengaluru', 'Bangalore Urban, Karnataka', 'Mysore', 'Remote - Bengaluru'],
+        'location_city': ['Bengaluru', 'Bengaluru', 'Mysuru', 'Bengaluru'],
+        'location_state': ['Karnataka', 'Karnataka', 'Karnataka', 'Karnataka'],
+        'work_mode': ['onsite', 'onsite', 'onsite', 'remote']
+    })
+    index = PostingIndex.build(df, vocabulary)
+    
+    assert index.query('java AND Bangalore').tolist() == [0, 1, 3]
+    assert index.query('location:blr').tolist() == [0, 1, 3]
+    assert index.query('location:"bangalore urban, karnataka"').tolist() == [0, 1, 3]
+    assert index.query('karnataka AND python').tolist() == [2]
+    assert index.query('"wfh bangalore"').tolist() == [3]
+    assert index.query('location:atlantis').tolist() == []
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from skill_bitset import SkillVocabulary, parse_skill_list, serialize_skill_list
+
+
+def test_pack_unpack_round_trip(vocabulary):
+    rng = np.random.default_rng(0)
+    bits = rng.random((50, len(vocabulary))) < 0.2
+    masks = vocabulary.pack(bits)
+    
+    assert masks.shape == (50, vocabulary.n_words)
+    assert (vocabulary.unpack(masks) == bits).all()
+
+
+def test_hex_round_trip(vocabulary):
+    masks = vocabulary.encode_many([['python', 'docker'], [], ['r', 'numpy', 'java']])
+    hex_values = vocabulary.to_hex(masks)
+    
+    assert all(len(value) == vocabulary.n_words * 16 for value in hex_values)
+    assert (vocabulary.from_hex(hex_values) == masks).all()
+
+
+def test_from_hex_rejects_wrong_width(vocabulary):
+    with pytest.raises(ValueError):
+        vocabulary.from_hex(['ff'])
+
+
+def test_encode_decode_keeps_vocabulary_order(vocabulary):
+    assert vocabulary.decode(vocabulary.encode(['docker', 'python', 'not a skill'])) == ['python', 'docker']
+
+
+def test_skills_past_one_word():
+    vocabulary = SkillVocabulary({'many': [f"skill{i}" for i in range(70)]})
+    assert vocabulary.n_words == 2
+    assert vocabulary.decode(vocabulary.encode(['skill0', 'skill64', 'skill69'])) == ['skill0', 'skill64', 'skill69']
+
+
+def test_dict_round_trip(vocabulary):
+    assert SkillVocabulary.from_dict(vocabulary.to_dict()) == vocabulary
+
+
+def test_skill_list_serialization():
+    assert parse_skill_list(serialize_skill_list(['python', 'c++'])) == ['python', 'c++']
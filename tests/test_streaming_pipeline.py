@@ -0,0 +1,116 @@
+import time
+import numpy as np
+import pandas as pd
+import pytest
+from data_scraper import JobDataScraper
+from data_cleaner import RecruitmentDataCleaner
+from data_annotator import RecruitmentDataAnnotator
+from streaming_pipeline import StreamingPipeline
+
+# company_id is numbered in first-seen order, which depends on how the site threads interleave
+COMPARED_COLUMNS = [
+    'source', 'content', 'content_type', 'job_title', 'company', 'location', 'salary', 'experience_level',
+    'exp_min_years', 'exp_max_years', 'company_canonical', 'location_city', 'location_state', 'work_mode',
+    'skill_mask', 'skill_count', 'experience_level_annotated', 'primary_skills', 'content_complexity',
+    'skill_diversity', 'profile_strength', 'question_type_annotated', 'difficulty_level', 'skill_focus'
+]
+
+
+class StubScraper(JobDataScraper):
+    # Replays fixed records through emit_record, like the site scrapers do, without any network access
+    def __init__(self, sites, delay=0.0):
+        super().__init__()
+        self.sites = sites
+        self.delay = delay
+        
+    def replay(self, records):
+        for record in records:
+            self.emit_record(dict(record))
+            time.sleep(self.delay)
+            
+    def site_scrapers(self):
+        return [(label, lambda records=records: self.replay(records)) for label, records in self.sites.items()]
+
+
+def scraped_records(raw_df):
+    records = []
+    for row in raw_df.to_dict('records'):
+        # Scrapers write "N/A" for missing elements of job cards
+        missing = 'N/A' if row['content_type'] == 'job_description' else ''
+        records.append({field: missing if pd.isna(value) else value for field, value in row.items()})
+    return records
+
+
+def streaming_pipeline(scraper, **kwargs):
+    return StreamingPipeline(scraper=scraper, cleaner=RecruitmentDataCleaner(input_file=None),
+                             annotator=RecruitmentDataAnnotator(input_file=None), **kwargs)
+
+
+def comparable(df):
+    columns = [column for column in COMPARED_COLUMNS if column in df.columns]
+    df = df[columns].astype(object).where(df[columns].notna(), None)
+    return df.sort_values('content').reset_index(drop=True)
+
+
+def batch_passes(records, tmp_path):
+    # The batch path goes through the raw CSV, as scraping then cleaning from disk does
+    batch_scraper = StubScraper({'all': records})
+    batch_scraper.replay(records)
+    raw_file = str(tmp_path / 'raw.csv')
+    batch_scraper.save_raw_data(raw_file)
+    annotator = RecruitmentDataAnnotator(input_file=None)
+    annotator.df = RecruitmentDataCleaner(input_file=None).clean_frame(pd.read_csv(raw_file))
+    batch = pd.concat(annotator.run_annotation_passes())
+    batch['skill_count'] = batch['skill_count'].astype('Int64')
+    return batch
+
+
+def test_streamed_records_match_batch_passes(raw_df, tmp_path):
+    records = scraped_records(raw_df)
+    sites = {'first half': records[::2], 'second half': records[1::2]}
+    
+    pipeline = streaming_pipeline(StubScraper(sites), queue_size=4)
+    streamed = pd.DataFrame(list(pipeline.stream()))
+    batch = batch_passes(records, tmp_path)
+    
+    assert pipeline.stats['annotated'] == len(batch)
+    pd.testing.assert_frame_equal(comparable(streamed), comparable(batch), check_dtype=False)
+
+
+def test_streamed_companies_resolve_from_the_raw_spelling(raw_df, tmp_path):
+    records = [record for record in scraped_records(raw_df) if record['content_type'] == 'job_description'][:6]
+    # Scraped HTML entities: text cleaning would turn "L&amp;T" into "LT" before resolution
+    for record, company in zip(records, ['L&amp;T Infotech', 'L&T Infotech', 'L and T Infotech'] * 2):
+        record['company'] = company
+        
+    pipeline = streaming_pipeline(StubScraper({'site': records}))
+    streamed = pd.DataFrame(list(pipeline.stream()))
+    batch = batch_passes(records, tmp_path)
+    
+    assert streamed['company_id'].nunique() == batch['company_id'].nunique() == 1
+    assert comparable(streamed)['company_canonical'].tolist() == comparable(batch)['company_canonical'].tolist()
+
+
+def test_duplicates_are_dropped_across_sites(raw_df):
+    records = scraped_records(raw_df)
+    pipeline = streaming_pipeline(StubScraper({'site a': records, 'site b': records[:10]}))
+    streamed = list(pipeline.stream())
+    
+    assert pipeline.stats['scraped'] == len(records) + 10
+    assert pipeline.stats['duplicates'] >= 10
+    assert len({record['content'] for record in streamed}) == len(streamed)
+
+
+def test_queues_bound_records_in_flight(raw_df):
+    records = scraped_records(raw_df) * 4
+    pipeline = streaming_pipeline(StubScraper({'site': records}), queue_size=2, n_cleaners=1, n_annotators=1)
+    stream = pipeline.stream()
+    
+    next(stream)
+    time.sleep(0.5)
+    # Three full queues, one record in each worker and one blocked in the sink, besides the one consumed
+    assert pipeline.stats['scraped'] <= 3 * 2 + 2 + 2
+    
+    remaining = list(stream)
+    assert pipeline.stats['scraped'] == len(records)
+    assert len(remaining) + 1 == pipeline.stats['annotated']
@@ -0,0 +1,25 @@
+import pytest
+from data_cleaner import RecruitmentDataCleaner
+from synthetic_data import SyntheticCorpusGenerator
+
+
+def duplicate_share(df):
+    cleaner = RecruitmentDataCleaner(input_file=None)
+    duplicated = sum(df[mask].duplicated(subset=subset).sum() for mask, subset in cleaner.dedup_groups(df))
+    return duplicated / len(df)
+
+
+def test_no_duplicates_without_duplicate_rate():
+    df = SyntheticCorpusGenerator(duplicate_rate=0).generate(20000, chunk_size=7000)
+    assert duplicate_share(df) == 0
+
+
+def test_duplicate_rate_controls_duplicates():
+    df = SyntheticCorpusGenerator(duplicate_rate=0.1).generate(20000, chunk_size=7000)
+    assert duplicate_share(df) == pytest.approx(0.1, abs=0.01)
+
+
+def test_chunks_regenerate_independently():
+    generator = SyntheticCorpusGenerator(seed=3)
+    df = generator.generate(3000, chunk_size=1000)
+    assert df.iloc[2000:].reset_index(drop=True).equals(generator.generate_chunk(1000, 2, 2000))